@@ -36,11 +36,18 @@ struct AhrsData {
 class ForeFlightEncoder {
 public:
   std::vector<uint8_t> createIdMessage(const DeviceInfo &data) const;
+  // Same frame as createIdMessage, re-encoded only when the device info
+  // differs from the previous call. The reference stays valid until the next
+  // call.
+  const std::vector<uint8_t> &cachedIdMessage(const DeviceInfo &data);
   std::vector<uint8_t> createAhrsMessage(const AhrsData &data) const;
 
 private:
   int16_t encodeAhrsAttitude(double degrees) const;
   uint16_t encodeAhrsHeading(double degrees, bool magnetic_heading) const;
+
+  DeviceInfo cached_id_info_;
+  std::vector<uint8_t> cached_id_message_;
 };
 
 } // namespace gdl90::foreflight
@@ -62,10 +62,13 @@ enum class TrackType : uint8_t {
   TRUE_HEADING = 3,
 };
 
+// Fields are grouped by size to minimise padding; traffic batches hold one of
+// these per target.
 struct PositionData {
   double latitude = 0.0;
   double longitude = 0.0;
   int32_t altitude = 0;
+  uint32_t icao_address = 0;
   uint16_t h_velocity = 0;
   int16_t v_velocity = 0;
   uint16_t track = 0;
@@ -73,12 +76,11 @@ struct PositionData {
   bool airborne = false;
   uint8_t nic = 0;
   uint8_t nacp = 0;
-  uint32_t icao_address = 0;
-  std::string callsign;
   EmitterCategory emitter_category = EmitterCategory::NO_INFO;
   AddressType address_type = AddressType::ADSB_ICAO;
   uint8_t alert_status = 0;
   uint8_t emergency_code = 0;
+  std::string callsign;
 };
 
 struct GeoAltitudeData {
@@ -100,6 +102,11 @@ public:
   std::vector<uint8_t>
   createOwnshipGeometricAltitude(const GeoAltitudeData &data) const;
   std::vector<uint8_t> createTrafficReport(const PositionData &data) const;
+  // Encodes one traffic frame per report into *out_messages, reusing the
+  // capacity of frames left over from a previous call.
+  void
+  createTrafficReports(const std::vector<PositionData> &reports,
+                       std::vector<std::vector<uint8_t>> *out_messages) const;
 
 private:
   CheckedUtcTimeProvider utc_time_provider_;
@@ -112,8 +119,8 @@ private:
   int16_t encodeGeoAltitude(int32_t altitude_feet) const;
   uint16_t encodeGeoVerticalMetrics(bool vertical_warning,
                                     uint16_t vfom_meters) const;
-  std::vector<uint8_t> createPositionReport(uint8_t msg_id,
-                                            const PositionData &data) const;
+  void createPositionReport(uint8_t msg_id, const PositionData &data,
+                            std::vector<uint8_t> *out_message) const;
   bool getUTCTime(uint32_t *out_time) const;
 };
 
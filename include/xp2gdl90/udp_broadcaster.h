@@ -27,6 +27,13 @@ struct SocketOps {
   virtual int InetPton(int af, const char *src, void *dst) = 0;
   virtual intptr_t SendTo(uintptr_t socket, const void *buf, size_t len,
                           int flags, const void *dest_addr, size_t addrlen) = 0;
+  // Sends buffers[0..count) as separate datagrams, stopping at the first
+  // failure. Returns how many leading buffers were sent; when that is less
+  // than count, buffers[result] was attempted and failed, and LastError()
+  // describes why.
+  virtual size_t SendToBatch(uintptr_t socket,
+                             const std::vector<uint8_t> *buffers, size_t count,
+                             int flags, const void *dest_addr, size_t addrlen);
   virtual int CloseSocket(uintptr_t socket) = 0;
   virtual int LastError() = 0;
 };
@@ -46,6 +53,11 @@ public:
   bool initialize();
   int send(const uint8_t *data, size_t size);
   int send(const std::vector<uint8_t> &data);
+  // Sends each message as its own datagram to the current target. Returns the
+  // number of datagrams sent, or -1 if nothing could be attempted; the byte
+  // total of the sent datagrams goes to out_bytes_sent when provided.
+  int sendBatch(const std::vector<std::vector<uint8_t>> &messages,
+                size_t *out_bytes_sent = nullptr);
   void setTarget(const std::string &target_ip, uint16_t target_port);
 
   bool isInitialized() const { return initialized_; }
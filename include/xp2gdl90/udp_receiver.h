@@ -16,6 +16,9 @@ public:
   ~UDPReceiver();
 
   bool initialize();
+  // Returns the datagram length, 0 when nothing is pending, or -1 on error.
+  // *out_data holds the datagram, or is left empty on a 0 or -1 return; reuse
+  // the same vector across polls to avoid reallocating it.
   int receive(std::vector<uint8_t> *out_data,
               std::string *out_source_ip = nullptr,
               uint16_t *out_source_port = nullptr);
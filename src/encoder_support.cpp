@@ -1,119 +1,141 @@
 #include "encoder_support.h"
 
 #include <algorithm>
+#include <array>
 
 namespace gdl90::internal {
 namespace {
 
-const uint16_t kCrc16Table[256] = {
-    0x0000, 0x1021, 0x2042, 0x3063, 0x4084, 0x50a5, 0x60c6, 0x70e7, 0x8108,
-    0x9129, 0xa14a, 0xb16b, 0xc18c, 0xd1ad, 0xe1ce, 0xf1ef, 0x1231, 0x0210,
-    0x3273, 0x2252, 0x52b5, 0x4294, 0x72f7, 0x62d6, 0x9339, 0x8318, 0xb37b,
-    0xa35a, 0xd3bd, 0xc39c, 0xf3ff, 0xe3de, 0x2462, 0x3443, 0x0420, 0x1401,
-    0x64e6, 0x74c7, 0x44a4, 0x5485, 0xa56a, 0xb54b, 0x8528, 0x9509, 0xe5ee,
-    0xf5cf, 0xc5ac, 0xd58d, 0x3653, 0x2672, 0x1611, 0x0630, 0x76d7, 0x66f6,
-    0x5695, 0x46b4, 0xb75b, 0xa77a, 0x9719, 0x8738, 0xf7df, 0xe7fe, 0xd79d,
-    0xc7bc, 0x48c4, 0x58e5, 0x6886, 0x78a7, 0x0840, 0x1861, 0x2802, 0x3823,
-    0xc9cc, 0xd9ed, 0xe98e, 0xf9af, 0x8948, 0x9969, 0xa90a, 0xb92b, 0x5af5,
-    0x4ad4, 0x7ab7, 0x6a96, 0x1a71, 0x0a50, 0x3a33, 0x2a12, 0xdbfd, 0xcbdc,
-    0xfbbf, 0xeb9e, 0x9b79, 0x8b58, 0xbb3b, 0xab1a, 0x6ca6, 0x7c87, 0x4ce4,
-    0x5cc5, 0x2c22, 0x3c03, 0x0c60, 0x1c41, 0xedae, 0xfd8f, 0xcdec, 0xddcd,
-    0xad2a, 0xbd0b, 0x8d68, 0x9d49, 0x7e97, 0x6eb6, 0x5ed5, 0x4ef4, 0x3e13,
-    0x2e32, 0x1e51, 0x0e70, 0xff9f, 0xefbe, 0xdfdd, 0xcffc, 0xbf1b, 0xaf3a,
-    0x9f59, 0x8f78, 0x9188, 0x81a9, 0xb1ca, 0xa1eb, 0xd10c, 0xc12d, 0xf14e,
-    0xe16f, 0x1080, 0x00a1, 0x30c2, 0x20e3, 0x5004, 0x4025, 0x7046, 0x6067,
-    0x83b9, 0x9398, 0xa3fb, 0xb3da, 0xc33d, 0xd31c, 0xe37f, 0xf35e, 0x02b1,
-    0x1290, 0x22f3, 0x32d2, 0x4235, 0x5214, 0x6277, 0x7256, 0xb5ea, 0xa5cb,
-    0x95a8, 0x8589, 0xf56e, 0xe54f, 0xd52c, 0xc50d, 0x34e2, 0x24c3, 0x14a0,
-    0x0481, 0x7466, 0x6447, 0x5424, 0x4405, 0xa7db, 0xb7fa, 0x8799, 0x97b8,
-    0xe75f, 0xf77e, 0xc71d, 0xd73c, 0x26d3, 0x36f2, 0x0691, 0x16b0, 0x6657,
-    0x7676, 0x4615, 0x5634, 0xd94c, 0xc96d, 0xf90e, 0xe92f, 0x99c8, 0x89e9,
-    0xb98a, 0xa9ab, 0x5844, 0x4865, 0x7806, 0x6827, 0x18c0, 0x08e1, 0x3882,
-    0x28a3, 0xcb7d, 0xdb5c, 0xeb3f, 0xfb1e, 0x8bf9, 0x9bd8, 0xabbb, 0xbb9a,
-    0x4a75, 0x5a54, 0x6a37, 0x7a16, 0x0af1, 0x1ad0, 0x2ab3, 0x3a92, 0xfd2e,
-    0xed0f, 0xdd6c, 0xcd4d, 0xbdaa, 0xad8b, 0x9de8, 0x8dc9, 0x7c26, 0x6c07,
-    0x5c64, 0x4c45, 0x3ca2, 0x2c83, 0x1ce0, 0x0cc1, 0xef1f, 0xff3e, 0xcf5d,
-    0xdf7c, 0xaf9b, 0xbfba, 0x8fd9, 0x9ff8, 0x6e17, 0x7e36, 0x4e55, 0x5e74,
-    0x2e93, 0x3eb2, 0x0ed1, 0x1ef0};
-
-uint16_t CalculateCrc(const std::vector<uint8_t> &data) {
+// CRC-16-CCITT generator polynomial (x^16 + x^12 + x^5 + 1).
+constexpr uint16_t kCrc16Polynomial = 0x1021;
+
+// Number of input bytes folded into the CRC per table round. Each table is
+// 512 bytes, so all eight stay resident in L1.
+constexpr size_t kCrcSlices = 8;
+
+using CrcTable = std::array<uint16_t, 256>;
+
+// tables[k][i] holds i * x^(16 + 8k) mod P, so a whole block of kCrcSlices
+// bytes can be folded into the register with independent lookups. tables[0]
+// is the classic byte-wise CCITT table. Built by an immediately invoked
+// lambda so the generator only ever runs at compile time.
+constexpr std::array<CrcTable, kCrcSlices> kSlicedCrcTables = [] {
+  std::array<CrcTable, kCrcSlices> tables{};
+  for (size_t i = 0; i < 256; ++i) {
+    uint16_t crc = static_cast<uint16_t>(i << 8);
+    for (int bit = 0; bit < 8; ++bit) {
+      crc = static_cast<uint16_t>((crc & 0x8000) ? (crc << 1) ^ kCrc16Polynomial
+                                                 : crc << 1);
+    }
+    tables[0][i] = crc;
+  }
+  for (size_t k = 1; k < kCrcSlices; ++k) {
+    for (size_t i = 0; i < 256; ++i) {
+      const uint16_t previous = tables[k - 1][i];
+      tables[k][i] =
+          static_cast<uint16_t>(tables[0][previous >> 8] ^ (previous << 8));
+    }
+  }
+  return tables;
+}();
+
+static_assert(kSlicedCrcTables[0][1] == 0x1021 &&
+                  kSlicedCrcTables[0][255] == 0x1ef0,
+              "CRC-16-CCITT table mismatch");
+
+uint16_t CalculateCrc(const uint8_t *data, size_t size) {
+  const auto &tables = kSlicedCrcTables;
   uint16_t crc = 0;
-  for (const uint8_t byte : data) {
-    crc = kCrc16Table[crc >> 8] ^ static_cast<uint16_t>(crc << 8) ^ byte;
+  while (size >= kCrcSlices) {
+    crc = static_cast<uint16_t>(
+        tables[7][crc >> 8] ^ tables[6][crc & 0xFF] ^ tables[5][data[0]] ^
+        tables[4][data[1]] ^ tables[3][data[2]] ^ tables[2][data[3]] ^
+        tables[1][data[4]] ^ tables[0][data[5]] ^ (data[6] << 8) ^ data[7]);
+    data += kCrcSlices;
+    size -= kCrcSlices;
+  }
+  // A half-width round picks up most of the tail; frames are rarely a
+  // multiple of eight bytes.
+  if (size >= 4) {
+    crc = static_cast<uint16_t>(tables[3][crc >> 8] ^ tables[2][crc & 0xFF] ^
+                                tables[1][data[0]] ^ tables[0][data[1]] ^
+                                (data[2] << 8) ^ data[3]);
+    data += 4;
+    size -= 4;
+  }
+  while (size-- > 0) {
+    crc = tables[0][crc >> 8] ^ static_cast<uint16_t>(crc << 8) ^ *data++;
   }
   return crc;
 }
 
-std::vector<uint8_t> EscapeMessage(const std::vector<uint8_t> &data) {
-  std::vector<uint8_t> escaped;
-  escaped.reserve(data.size() + 10);
-
-  for (const uint8_t byte : data) {
-    if (byte == 0x7D || byte == 0x7E) {
-      escaped.push_back(0x7D);
-      escaped.push_back(static_cast<uint8_t>(byte ^ 0x20));
-    } else {
-      escaped.push_back(byte);
+bool NeedsEscape(uint8_t byte) { return byte == 0x7D || byte == 0x7E; }
+
+void AppendEscaped(const uint8_t *data, size_t size,
+                   std::vector<uint8_t> *out) {
+  const uint8_t *const end = data + size;
+  while (data != end) {
+    // Copy each run of plain bytes in one insert. Flag and escape bytes are
+    // rare in practice, so this is usually the whole buffer.
+    const uint8_t *const special = std::find_if(data, end, NeedsEscape);
+    out->insert(out->end(), data, special);
+    if (special == end) {
+      break;
     }
+    out->push_back(0x7D);
+    out->push_back(static_cast<uint8_t>(*special ^ 0x20));
+    data = special + 1;
   }
-
-  return escaped;
 }
 
 } // namespace
 
-std::vector<uint8_t> PrepareMessage(const std::vector<uint8_t> &payload) {
-  const uint16_t crc = CalculateCrc(payload);
-
-  std::vector<uint8_t> message = payload;
-  message.push_back(static_cast<uint8_t>(crc & 0xFF));
-  message.push_back(static_cast<uint8_t>((crc >> 8) & 0xFF));
-
-  const std::vector<uint8_t> escaped = EscapeMessage(message);
-
-  std::vector<uint8_t> final_message;
-  final_message.reserve(escaped.size() + 2);
-  final_message.push_back(0x7E);
-  final_message.insert(final_message.end(), escaped.begin(), escaped.end());
-  final_message.push_back(0x7E);
+void PrepareMessage(const uint8_t *payload, size_t size,
+                    std::vector<uint8_t> *out_message) {
+  const uint16_t crc = CalculateCrc(payload, size);
+  const uint8_t crc_bytes[2] = {static_cast<uint8_t>(crc & 0xFF),
+                                static_cast<uint8_t>((crc >> 8) & 0xFF)};
+
+  // Worst case every payload and CRC byte is stuffed, plus the two flags.
+  out_message->clear();
+  out_message->reserve(2 * (size + sizeof(crc_bytes)) + 2);
+  out_message->push_back(0x7E);
+  AppendEscaped(payload, size, out_message);
+  AppendEscaped(crc_bytes, sizeof(crc_bytes), out_message);
+  out_message->push_back(0x7E);
+}
 
-  return final_message;
+std::vector<uint8_t> PrepareMessage(const uint8_t *payload, size_t size) {
+  std::vector<uint8_t> message;
+  PrepareMessage(payload, size, &message);
+  return message;
 }
 
-void AppendBigEndian16(std::vector<uint8_t> &buffer, uint16_t value) {
-  buffer.push_back(static_cast<uint8_t>((value >> 8) & 0xFF));
-  buffer.push_back(static_cast<uint8_t>(value & 0xFF));
+void StoreBigEndian16(uint8_t *out, uint16_t value) {
+  out[0] = static_cast<uint8_t>((value >> 8) & 0xFF);
+  out[1] = static_cast<uint8_t>(value & 0xFF);
 }
 
-void AppendBigEndian32(std::vector<uint8_t> &buffer, uint32_t value) {
-  buffer.push_back(static_cast<uint8_t>((value >> 24) & 0xFF));
-  buffer.push_back(static_cast<uint8_t>((value >> 16) & 0xFF));
-  buffer.push_back(static_cast<uint8_t>((value >> 8) & 0xFF));
-  buffer.push_back(static_cast<uint8_t>(value & 0xFF));
+void StoreBigEndian24(uint8_t *out, uint32_t value) {
+  out[0] = static_cast<uint8_t>((value >> 16) & 0xFF);
+  out[1] = static_cast<uint8_t>((value >> 8) & 0xFF);
+  out[2] = static_cast<uint8_t>(value & 0xFF);
 }
 
-void AppendBigEndian64(std::vector<uint8_t> &buffer, uint64_t value) {
-  buffer.push_back(static_cast<uint8_t>((value >> 56) & 0xFF));
-  buffer.push_back(static_cast<uint8_t>((value >> 48) & 0xFF));
-  buffer.push_back(static_cast<uint8_t>((value >> 40) & 0xFF));
-  buffer.push_back(static_cast<uint8_t>((value >> 32) & 0xFF));
-  buffer.push_back(static_cast<uint8_t>((value >> 24) & 0xFF));
-  buffer.push_back(static_cast<uint8_t>((value >> 16) & 0xFF));
-  buffer.push_back(static_cast<uint8_t>((value >> 8) & 0xFF));
-  buffer.push_back(static_cast<uint8_t>(value & 0xFF));
+void StoreBigEndian32(uint8_t *out, uint32_t value) {
+  StoreBigEndian16(out, static_cast<uint16_t>(value >> 16));
+  StoreBigEndian16(out + 2, static_cast<uint16_t>(value & 0xFFFF));
 }
 
-void AppendFixedText(std::vector<uint8_t> &buffer, const std::string &value,
-                     size_t width) {
-  const size_t count = std::min(value.size(), width);
-  buffer.insert(buffer.end(), value.begin(), value.begin() + count);
-  buffer.insert(buffer.end(), width - count, 0x00);
+void StoreBigEndian64(uint8_t *out, uint64_t value) {
+  StoreBigEndian32(out, static_cast<uint32_t>(value >> 32));
+  StoreBigEndian32(out + 4, static_cast<uint32_t>(value & 0xFFFFFFFF));
 }
 
-void Pack24Bit(std::vector<uint8_t> &buffer, uint32_t value) {
-  buffer.push_back(static_cast<uint8_t>((value >> 16) & 0xFF));
-  buffer.push_back(static_cast<uint8_t>((value >> 8) & 0xFF));
-  buffer.push_back(static_cast<uint8_t>(value & 0xFF));
+void StoreFixedText(uint8_t *out, const std::string &value, size_t width) {
+  const size_t count = std::min(value.size(), width);
+  std::copy_n(value.begin(), count, out);
+  std::fill(out + count, out + width, 0x00);
 }
 
 } // namespace gdl90::internal
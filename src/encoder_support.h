@@ -1,6 +1,7 @@
 #ifndef XP2GDL90_ENCODER_SUPPORT_H
 #define XP2GDL90_ENCODER_SUPPORT_H
 
+#include <array>
 #include <cstddef>
 #include <cstdint>
 #include <string>
@@ -8,14 +9,30 @@
 
 namespace gdl90::internal {
 
-std::vector<uint8_t> PrepareMessage(const std::vector<uint8_t>& payload);
-void AppendBigEndian16(std::vector<uint8_t>& buffer, uint16_t value);
-void AppendBigEndian32(std::vector<uint8_t>& buffer, uint32_t value);
-void AppendBigEndian64(std::vector<uint8_t>& buffer, uint64_t value);
-void AppendFixedText(std::vector<uint8_t>& buffer,
-                     const std::string& value,
-                     size_t width);
-void Pack24Bit(std::vector<uint8_t>& buffer, uint32_t value);
+// Frames a payload (CRC, byte stuffing, flag bytes). The out-parameter form
+// overwrites *out_message and reuses its capacity.
+void PrepareMessage(const uint8_t* payload,
+                    size_t size,
+                    std::vector<uint8_t>* out_message);
+std::vector<uint8_t> PrepareMessage(const uint8_t* payload, size_t size);
+
+template <size_t N>
+std::vector<uint8_t> PrepareMessage(const std::array<uint8_t, N>& payload) {
+  return PrepareMessage(payload.data(), payload.size());
+}
+
+template <size_t N>
+void PrepareMessage(const std::array<uint8_t, N>& payload,
+                    std::vector<uint8_t>* out_message) {
+  PrepareMessage(payload.data(), payload.size(), out_message);
+}
+
+void StoreBigEndian16(uint8_t* out, uint16_t value);
+void StoreBigEndian24(uint8_t* out, uint32_t value);
+void StoreBigEndian32(uint8_t* out, uint32_t value);
+void StoreBigEndian64(uint8_t* out, uint64_t value);
+// Copies up to width bytes of value and zero-fills the rest of the field.
+void StoreFixedText(uint8_t* out, const std::string& value, size_t width);
 
 }  // namespace gdl90::internal
 
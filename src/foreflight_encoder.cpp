@@ -2,9 +2,18 @@
 
 #include "encoder_support.h"
 
+#include <array>
 #include <cmath>
 
 namespace gdl90::foreflight {
+namespace {
+
+constexpr size_t kIdPayloadSize = 39;
+constexpr size_t kAhrsPayloadSize = 12;
+constexpr size_t kDeviceNameSize = 8;
+constexpr size_t kDeviceLongNameSize = 16;
+
+} // namespace
 
 int16_t ForeFlightEncoder::encodeAhrsAttitude(double degrees) const {
   if (!std::isfinite(degrees)) {
@@ -44,35 +53,45 @@ uint16_t ForeFlightEncoder::encodeAhrsHeading(double degrees,
 
 std::vector<uint8_t>
 ForeFlightEncoder::createIdMessage(const DeviceInfo &data) const {
-  std::vector<uint8_t> payload;
-  payload.reserve(39);
-
-  payload.push_back(MSG_ID_FORE_FLIGHT);
-  payload.push_back(SUB_ID_DEVICE_INFO);
-  payload.push_back(0x01);
-  internal::AppendBigEndian64(payload, data.serial_number);
-  internal::AppendFixedText(payload, data.device_name, 8);
-  internal::AppendFixedText(payload, data.device_long_name, 16);
-  internal::AppendBigEndian32(payload, data.capabilities_mask);
+  std::array<uint8_t, kIdPayloadSize> payload{};
+  payload[0] = MSG_ID_FORE_FLIGHT;
+  payload[1] = SUB_ID_DEVICE_INFO;
+  payload[2] = 0x01;
+  internal::StoreBigEndian64(&payload[3], data.serial_number);
+  internal::StoreFixedText(&payload[11], data.device_name, kDeviceNameSize);
+  internal::StoreFixedText(&payload[19], data.device_long_name,
+                           kDeviceLongNameSize);
+  internal::StoreBigEndian32(&payload[35], data.capabilities_mask);
 
   return internal::PrepareMessage(payload);
 }
 
+const std::vector<uint8_t> &
+ForeFlightEncoder::cachedIdMessage(const DeviceInfo &data) {
+  if (cached_id_message_.empty() ||
+      cached_id_info_.serial_number != data.serial_number ||
+      cached_id_info_.capabilities_mask != data.capabilities_mask ||
+      cached_id_info_.device_name != data.device_name ||
+      cached_id_info_.device_long_name != data.device_long_name) {
+    cached_id_info_ = data;
+    cached_id_message_ = createIdMessage(data);
+  }
+  return cached_id_message_;
+}
+
 std::vector<uint8_t>
 ForeFlightEncoder::createAhrsMessage(const AhrsData &data) const {
-  std::vector<uint8_t> payload;
-  payload.reserve(12);
-
-  payload.push_back(MSG_ID_FORE_FLIGHT);
-  payload.push_back(SUB_ID_AHRS);
-  internal::AppendBigEndian16(
-      payload, static_cast<uint16_t>(encodeAhrsAttitude(data.roll_deg)));
-  internal::AppendBigEndian16(
-      payload, static_cast<uint16_t>(encodeAhrsAttitude(data.pitch_deg)));
-  internal::AppendBigEndian16(
-      payload, encodeAhrsHeading(data.heading_deg, data.magnetic_heading));
-  internal::AppendBigEndian16(payload, data.indicated_airspeed);
-  internal::AppendBigEndian16(payload, data.true_airspeed);
+  std::array<uint8_t, kAhrsPayloadSize> payload{};
+  payload[0] = MSG_ID_FORE_FLIGHT;
+  payload[1] = SUB_ID_AHRS;
+  internal::StoreBigEndian16(
+      &payload[2], static_cast<uint16_t>(encodeAhrsAttitude(data.roll_deg)));
+  internal::StoreBigEndian16(
+      &payload[4], static_cast<uint16_t>(encodeAhrsAttitude(data.pitch_deg)));
+  internal::StoreBigEndian16(
+      &payload[6], encodeAhrsHeading(data.heading_deg, data.magnetic_heading));
+  internal::StoreBigEndian16(&payload[8], data.indicated_airspeed);
+  internal::StoreBigEndian16(&payload[10], data.true_airspeed);
 
   return internal::PrepareMessage(payload);
 }
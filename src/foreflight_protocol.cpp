@@ -1,21 +1,31 @@
 #include "xp2gdl90/foreflight_protocol.h"
 
 #include <cmath>
-#include <string>
+#include <string_view>
 
 #include "xp2gdl90/simple_json.h"
 
 namespace xp2gdl90::foreflight {
+namespace {
+
+// The shortest broadcast that can pass every check below. Anything smaller is
+// rejected without running the JSON parser.
+constexpr std::string_view kShortestDiscovery =
+    R"({"App":"ForeFlight","GDL90":{"port":1}})";
+
+} // namespace
 
 bool ParseDiscoveryBroadcast(const std::vector<uint8_t> &packet,
                              uint16_t *out_port) {
-  if (!out_port || packet.empty()) {
+  if (!out_port || packet.size() < kShortestDiscovery.size()) {
     return false;
   }
 
+  // Parse the datagram in place rather than copying it into a std::string.
+  const std::string_view text(reinterpret_cast<const char *>(packet.data()),
+                              packet.size());
   json::Value root;
-  if (!json::Parse(std::string(packet.begin(), packet.end()), &root, nullptr) ||
-      !root.IsObject()) {
+  if (!json::Parse(text, &root, nullptr) || !root.IsObject()) {
     return false;
   }
 
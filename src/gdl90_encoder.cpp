@@ -3,15 +3,33 @@
 #include "encoder_support.h"
 
 #include <algorithm>
+#include <array>
 #include <cmath>
 #include <ctime>
 #include <utility>
 
-#if defined(_WIN32)
-#include <time.h>
-#endif
-
 namespace gdl90 {
+namespace {
+
+// Fixed payload layouts (before CRC and byte stuffing).
+constexpr size_t kHeartbeatPayloadSize = 7;
+constexpr size_t kPositionReportPayloadSize = 28;
+constexpr size_t kGeoAltitudePayloadSize = 5;
+constexpr size_t kCallsignFieldSize = 8;
+
+// 24-bit two's complement semicircles: 180 degrees == 0x800000.
+constexpr double kCoordinateScale = 0x800000 / 180.0;
+
+uint32_t EncodeCoordinate(double degrees, double limit) {
+  const double clamped = std::max(-limit, std::min(limit, degrees));
+  // Masking the sign-extended value yields the 24-bit two's complement form
+  // directly, so negative inputs need no separate wrap.
+  return static_cast<uint32_t>(
+             static_cast<int32_t>(clamped * kCoordinateScale)) &
+         0xFFFFFFu;
+}
+
+} // namespace
 
 GDL90Encoder::GDL90Encoder() = default;
 
@@ -29,25 +47,11 @@ GDL90Encoder::GDL90Encoder(CheckedUtcTimeProvider utc_time_provider)
     : utc_time_provider_(std::move(utc_time_provider)) {}
 
 uint32_t GDL90Encoder::encodeLatitude(double latitude) const {
-  latitude = std::max(-90.0, std::min(90.0, latitude));
-
-  int32_t value = static_cast<int32_t>(latitude * (0x800000 / 180.0));
-  if (value < 0) {
-    value = (0x1000000 + value) & 0xFFFFFF;
-  }
-
-  return static_cast<uint32_t>(value);
+  return EncodeCoordinate(latitude, 90.0);
 }
 
 uint32_t GDL90Encoder::encodeLongitude(double longitude) const {
-  longitude = std::max(-180.0, std::min(180.0, longitude));
-
-  int32_t value = static_cast<int32_t>(longitude * (0x800000 / 180.0));
-  if (value < 0) {
-    value = (0x1000000 + value) & 0xFFFFFF;
-  }
-
-  return static_cast<uint32_t>(value);
+  return EncodeCoordinate(longitude, 180.0);
 }
 
 uint16_t GDL90Encoder::encodeAltitude(int32_t altitude) const {
@@ -79,12 +83,9 @@ uint16_t GDL90Encoder::encodeVerticalVelocity(int16_t vv_fpm) const {
     return 0xE02;
   }
 
-  int16_t value = static_cast<int16_t>(vv_fpm / 64);
-  if (value < 0) {
-    value = (0x1000 + value) & 0xFFF;
-  }
-
-  return static_cast<uint16_t>(value);
+  // As with coordinates, masking the sign-extended value gives the 12-bit
+  // two's complement form without a separate negative branch.
+  return static_cast<uint16_t>(static_cast<uint16_t>(vv_fpm / 64) & 0xFFFu);
 }
 
 uint8_t GDL90Encoder::encodeTrack(uint16_t track) const {
@@ -133,29 +134,23 @@ bool GDL90Encoder::getUTCTime(uint32_t *out_time) const {
     return false;
   }
 
-  std::tm utc{};
-#if defined(_WIN32)
-  gmtime_s(&utc, &now);
-#else
-  gmtime_r(&now, &utc);
-#endif
-  *out_time =
-      static_cast<uint32_t>(utc.tm_hour * 3600 + utc.tm_min * 60 + utc.tm_sec);
+  // Epoch time has no leap seconds, so seconds since UTC midnight fall out of
+  // a modulo without a gmtime() conversion.
+  constexpr std::time_t kSecondsPerDay = 86400;
+  *out_time = static_cast<uint32_t>(now % kSecondsPerDay);
   return true;
 }
 
 std::vector<uint8_t> GDL90Encoder::createHeartbeat(bool gps_valid,
                                                    bool utc_ok) const {
-  std::vector<uint8_t> payload;
-  payload.reserve(7);
-
-  payload.push_back(MSG_ID_HEARTBEAT);
+  std::array<uint8_t, kHeartbeatPayloadSize> payload{};
+  payload[0] = MSG_ID_HEARTBEAT;
 
   uint8_t status1 = 0x01;
   if (gps_valid) {
     status1 |= 0x80;
   }
-  payload.push_back(status1);
+  payload[1] = status1;
 
   uint32_t timestamp = 0;
   const bool have_utc_time = getUTCTime(&timestamp);
@@ -166,44 +161,38 @@ std::vector<uint8_t> GDL90Encoder::createHeartbeat(bool gps_valid,
   if (timestamp & 0x10000) {
     status2 |= 0x80;
   }
-  payload.push_back(status2);
+  payload[2] = status2;
 
-  payload.push_back(static_cast<uint8_t>(timestamp & 0xFF));
-  payload.push_back(static_cast<uint8_t>((timestamp >> 8) & 0xFF));
-
-  payload.push_back(0x00);
-  payload.push_back(0x00);
+  payload[3] = static_cast<uint8_t>(timestamp & 0xFF);
+  payload[4] = static_cast<uint8_t>((timestamp >> 8) & 0xFF);
+  // Bytes 5-6 carry the uplink/basic message counts, which stay zero.
 
   return internal::PrepareMessage(payload);
 }
 
-std::vector<uint8_t>
-GDL90Encoder::createPositionReport(uint8_t msg_id,
-                                   const PositionData &data) const {
-  std::vector<uint8_t> payload;
-  payload.reserve(28);
-
-  payload.push_back(msg_id);
-
-  const uint8_t st =
+void GDL90Encoder::createPositionReport(
+    uint8_t msg_id, const PositionData &data,
+    std::vector<uint8_t> *out_message) const {
+  std::array<uint8_t, kPositionReportPayloadSize> payload{};
+  payload[0] = msg_id;
+  payload[1] =
       static_cast<uint8_t>(((data.alert_status & 0x0F) << 4) |
                            (static_cast<uint8_t>(data.address_type) & 0x0F));
-  payload.push_back(st);
 
-  internal::Pack24Bit(payload, data.icao_address);
-  internal::Pack24Bit(payload, encodeLatitude(data.latitude));
-  internal::Pack24Bit(payload, encodeLongitude(data.longitude));
+  internal::StoreBigEndian24(&payload[2], data.icao_address);
+  internal::StoreBigEndian24(&payload[5], encodeLatitude(data.latitude));
+  internal::StoreBigEndian24(&payload[8], encodeLongitude(data.longitude));
 
   const uint16_t altitude = encodeAltitude(data.altitude);
   const uint8_t misc = static_cast<uint8_t>(
       (static_cast<uint8_t>(data.airborne) << 3) | (0 << 2) |
       (static_cast<uint8_t>(data.track_type) & 0x03));
 
-  payload.push_back(static_cast<uint8_t>((altitude >> 4) & 0xFF));
-  payload.push_back(static_cast<uint8_t>(((altitude & 0x0F) << 4) | misc));
+  payload[11] = static_cast<uint8_t>((altitude >> 4) & 0xFF);
+  payload[12] = static_cast<uint8_t>(((altitude & 0x0F) << 4) | misc);
 
-  payload.push_back(
-      static_cast<uint8_t>(((data.nic & 0x0F) << 4) | (data.nacp & 0x0F)));
+  payload[13] =
+      static_cast<uint8_t>(((data.nic & 0x0F) << 4) | (data.nacp & 0x0F));
 
   const uint16_t h_vel =
       (data.h_velocity == VELOCITY_INVALID)
@@ -211,40 +200,41 @@ GDL90Encoder::createPositionReport(uint8_t msg_id,
           : std::min(data.h_velocity, static_cast<uint16_t>(0xFFE));
   const uint16_t v_vel = encodeVerticalVelocity(data.v_velocity);
 
-  payload.push_back(static_cast<uint8_t>((h_vel >> 4) & 0xFF));
-  payload.push_back(
-      static_cast<uint8_t>(((h_vel & 0x0F) << 4) | ((v_vel >> 8) & 0x0F)));
-  payload.push_back(static_cast<uint8_t>(v_vel & 0xFF));
+  payload[14] = static_cast<uint8_t>((h_vel >> 4) & 0xFF);
+  payload[15] =
+      static_cast<uint8_t>(((h_vel & 0x0F) << 4) | ((v_vel >> 8) & 0x0F));
+  payload[16] = static_cast<uint8_t>(v_vel & 0xFF);
 
-  payload.push_back(encodeTrack(data.track));
-  payload.push_back(static_cast<uint8_t>(data.emitter_category));
+  payload[17] = encodeTrack(data.track);
+  payload[18] = static_cast<uint8_t>(data.emitter_category);
 
-  std::string callsign = data.callsign.substr(0, 8);
-  callsign.resize(8, ' ');
-  for (const char ch : callsign) {
-    payload.push_back(static_cast<uint8_t>(ch));
-  }
+  const size_t callsign_length =
+      std::min(data.callsign.size(), kCallsignFieldSize);
+  std::copy_n(data.callsign.begin(), callsign_length, &payload[19]);
+  std::fill(&payload[19] + callsign_length, &payload[19] + kCallsignFieldSize,
+            static_cast<uint8_t>(' '));
 
-  payload.push_back(static_cast<uint8_t>((data.emergency_code & 0x0F) << 4));
+  payload[27] = static_cast<uint8_t>((data.emergency_code & 0x0F) << 4);
 
-  return internal::PrepareMessage(payload);
+  internal::PrepareMessage(payload, out_message);
 }
 
 std::vector<uint8_t>
 GDL90Encoder::createOwnshipReport(const PositionData &data) const {
-  return createPositionReport(MSG_ID_OWNSHIP_REPORT, data);
+  std::vector<uint8_t> message;
+  createPositionReport(MSG_ID_OWNSHIP_REPORT, data, &message);
+  return message;
 }
 
 std::vector<uint8_t> GDL90Encoder::createOwnshipGeometricAltitude(
     const GeoAltitudeData &data) const {
-  std::vector<uint8_t> payload;
-  payload.reserve(5);
-
-  payload.push_back(MSG_ID_OWNSHIP_GEO_ALTITUDE);
-  internal::AppendBigEndian16(
-      payload, static_cast<uint16_t>(encodeGeoAltitude(data.altitude_feet)));
-  internal::AppendBigEndian16(
-      payload,
+  std::array<uint8_t, kGeoAltitudePayloadSize> payload{};
+  payload[0] = MSG_ID_OWNSHIP_GEO_ALTITUDE;
+  internal::StoreBigEndian16(
+      &payload[1],
+      static_cast<uint16_t>(encodeGeoAltitude(data.altitude_feet)));
+  internal::StoreBigEndian16(
+      &payload[3],
       encodeGeoVerticalMetrics(data.vertical_warning, data.vfom_meters));
 
   return internal::PrepareMessage(payload);
@@ -252,7 +242,23 @@ std::vector<uint8_t> GDL90Encoder::createOwnshipGeometricAltitude(
 
 std::vector<uint8_t>
 GDL90Encoder::createTrafficReport(const PositionData &data) const {
-  return createPositionReport(MSG_ID_TRAFFIC_REPORT, data);
+  std::vector<uint8_t> message;
+  createPositionReport(MSG_ID_TRAFFIC_REPORT, data, &message);
+  return message;
+}
+
+void GDL90Encoder::createTrafficReports(
+    const std::vector<PositionData> &reports,
+    std::vector<std::vector<uint8_t>> *out_messages) const {
+  if (!out_messages) {
+    return;
+  }
+
+  out_messages->resize(reports.size());
+  for (size_t i = 0; i < reports.size(); ++i) {
+    createPositionReport(MSG_ID_TRAFFIC_REPORT, reports[i],
+                         &(*out_messages)[i]);
+  }
 }
 
 } // namespace gdl90
@@ -132,6 +132,9 @@ struct PluginState {
   std::unique_ptr<gdl90::foreflight::ForeFlightEncoder> foreflight_encoder;
   std::unique_ptr<udp::UDPBroadcaster> broadcaster;
   std::unique_ptr<udp::UDPReceiver> foreflight_receiver;
+  // Receive buffer kept across flight loops so idle polls do not allocate.
+  std::vector<uint8_t> discovery_packet;
+  std::string discovery_source_ip;
   Settings settings;
 
   XPLMDataRef lat_ref = nullptr;
@@ -153,6 +156,9 @@ struct PluginState {
   TrafficTcasRefs traffic_tcas_refs;
   std::vector<LegacyTrafficRefs> legacy_traffic_refs;
   std::vector<TrafficTextRefs> traffic_text_refs;
+  // Reused across traffic ticks so steady-state sends do not reallocate.
+  std::vector<gdl90::PositionData> traffic_reports;
+  std::vector<std::vector<uint8_t>> traffic_frames;
 
   float last_heartbeat = 0.0f;
   float last_position = 0.0f;
@@ -663,20 +669,21 @@ bool BuildTrafficReportFromLegacySlot(const Settings &cfg, size_t slot,
   const float vz = XPLMGetDataf(refs.vz_ref);
   const float heading = XPLMGetDataf(refs.heading_ref);
 
-  const std::string identity = ReadTrafficIdentity(slot);
-  const uint32_t synthetic_address = xp2gdl90::traffic::SyntheticTrafficAddress(
-      slot, identity, cfg.icao_address);
-  const std::string callsign =
-      identity.empty() ? FormatTrafficFallbackCallsign(synthetic_address)
-                       : identity;
-
   if (!std::isfinite(static_cast<double>(local_x)) ||
       !std::isfinite(static_cast<double>(local_y)) ||
       !std::isfinite(static_cast<double>(local_z))) {
     return false;
   }
+
+  const std::string identity = ReadTrafficIdentity(slot);
+  const uint32_t synthetic_address = xp2gdl90::traffic::SyntheticTrafficAddress(
+      slot, identity, cfg.icao_address);
+  const std::string fallback_callsign =
+      FormatTrafficFallbackCallsign(synthetic_address);
+  const std::string &callsign = identity.empty() ? fallback_callsign : identity;
+
   if (local_x == 0.0f && local_y == 0.0f && local_z == 0.0f &&
-      callsign == FormatTrafficFallbackCallsign(synthetic_address)) {
+      callsign == fallback_callsign) {
     return false;
   }
 
@@ -1058,11 +1065,14 @@ void InitializeTrafficDataRefs() {
 
 size_t CollectTrafficData(const Settings &cfg,
                           std::vector<gdl90::PositionData> *out_reports) {
-  if (!out_reports || !cfg.traffic_enabled || cfg.traffic_max_targets == 0) {
+  if (!out_reports) {
     return 0;
   }
 
   out_reports->clear();
+  if (!cfg.traffic_enabled || cfg.traffic_max_targets == 0) {
+    return 0;
+  }
 
   if (g_state.traffic_tcas_refs.IsUsable()) {
     const size_t max_slots =
@@ -1101,29 +1111,26 @@ void SendTrafficReports(float sim_time, const Settings &cfg) {
     return;
   }
 
-  std::vector<gdl90::PositionData> reports;
-  const size_t report_count = CollectTrafficData(cfg, &reports);
+  const size_t report_count = CollectTrafficData(cfg, &g_state.traffic_reports);
 
-  int total_bytes = 0;
-  bool saw_error = false;
-  for (const gdl90::PositionData &report : reports) {
-    const auto message = g_state.encoder->createTrafficReport(report);
-    const int sent = g_state.broadcaster->send(message);
-    if (sent >= 0) {
-      total_bytes += sent;
-      g_state.bytes_sent += static_cast<uint64_t>(sent);
-      g_state.traffic_packets_sent++;
-    } else {
-      saw_error = true;
-      g_state.last_send_error = g_state.broadcaster->getLastError();
-    }
-  }
+  g_state.encoder->createTrafficReports(g_state.traffic_reports,
+                                        &g_state.traffic_frames);
 
-  g_state.last_traffic_send_bytes = total_bytes;
-  g_state.last_traffic_target_count = static_cast<int>(report_count);
-  if (!saw_error) {
+  size_t batch_bytes = 0;
+  const int sent_count =
+      g_state.broadcaster->sendBatch(g_state.traffic_frames, &batch_bytes);
+  if (sent_count > 0) {
+    g_state.bytes_sent += static_cast<uint64_t>(batch_bytes);
+    g_state.traffic_packets_sent += static_cast<uint64_t>(sent_count);
+  }
+  if (sent_count < static_cast<int>(g_state.traffic_frames.size())) {
+    g_state.last_send_error = g_state.broadcaster->getLastError();
+  } else {
     g_state.last_send_error.clear();
   }
+
+  g_state.last_traffic_send_bytes = static_cast<int>(batch_bytes);
+  g_state.last_traffic_target_count = static_cast<int>(report_count);
   g_state.last_traffic = sim_time;
 }
 
@@ -1132,9 +1139,9 @@ void PollForeFlightDiscovery(float sim_time, const Settings &cfg) {
     return;
   }
 
+  std::vector<uint8_t> &packet = g_state.discovery_packet;
+  std::string &source_ip = g_state.discovery_source_ip;
   while (true) {
-    std::vector<uint8_t> packet;
-    std::string source_ip;
     uint16_t source_port = 0;
     const int received =
         g_state.foreflight_receiver->receive(&packet, &source_ip, &source_port);
@@ -2091,8 +2098,8 @@ float FlightLoopCallback(float in_elapsed_since_last_call,
 
   if (broadcast_time - g_state.last_device_info >=
       (1.0f / kForeFlightDeviceInfoRate)) {
-    const auto device_info =
-        g_state.foreflight_encoder->createIdMessage(GetForeFlightDeviceInfo());
+    const auto &device_info =
+        g_state.foreflight_encoder->cachedIdMessage(GetForeFlightDeviceInfo());
     const int sent = g_state.broadcaster->send(device_info);
     g_state.last_device_info_send_bytes = sent;
     if (sent >= 0) {
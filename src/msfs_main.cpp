@@ -19,9 +19,9 @@
 #include <iomanip>
 #include <limits>
 #include <memory>
-#include <mutex>
 #include <sstream>
 #include <string>
+#include <unordered_map>
 #include <vector>
 
 #include "backends/imgui_impl_dx11.h"
@@ -58,6 +58,10 @@ constexpr DWORD kTrafficRadiusMeters = 20000;
 constexpr int kLogMaxLines = 500;
 constexpr float kWindowWidth = 960.0f;
 constexpr float kWindowHeight = 680.0f;
+// Upper bound on how long the loop blocks for window messages while the
+// window is hidden and vsync no longer paces it. The actual wait ends at the
+// next packet deadline, so this only bounds SimConnect and discovery polling.
+constexpr double kOccludedMaxWaitSeconds = 0.1;
 
 // ---------------------------------------------------------------------------
 // SimConnect data structures (must match AddSimVar order exactly)
@@ -120,13 +124,13 @@ struct LogEntry {
   bool is_error = false;
 };
 
+// Written and drawn only from the UI thread, which also polls SimConnect and
+// the sockets, so no locking is needed.
 struct LogBuffer {
-  std::mutex mutex;
   std::deque<LogEntry> entries;
   bool scroll_to_bottom = false;
 
   void Add(bool is_error, std::string text) {
-    std::lock_guard<std::mutex> lock(mutex);
     entries.push_back({std::move(text), is_error});
     if (static_cast<int>(entries.size()) > kLogMaxLines) {
       entries.pop_front();
@@ -159,11 +163,15 @@ struct BridgeState {
   bool ownship_valid = false;
   OwnshipSimData ownship;
   std::vector<TrafficEntry> traffic;
+  std::unordered_map<DWORD, size_t> traffic_index; // object_id -> traffic slot
 
   std::unique_ptr<gdl90::GDL90Encoder> encoder;
   std::unique_ptr<gdl90::foreflight::ForeFlightEncoder> foreflight_encoder;
   std::unique_ptr<udp::UDPBroadcaster> broadcaster;
   std::unique_ptr<udp::UDPReceiver> foreflight_receiver;
+  // Receive buffer kept across loop iterations so idle polls do not allocate.
+  std::vector<uint8_t> discovery_packet;
+  std::string discovery_source_ip;
 
   std::string discovered_target_ip;
   uint16_t discovered_target_port = 0;
@@ -191,6 +199,7 @@ static ID3D11Device *g_device = nullptr;
 static ID3D11DeviceContext *g_device_context = nullptr;
 static IDXGISwapChain *g_swap_chain = nullptr;
 static ID3D11RenderTargetView *g_rtv = nullptr;
+static bool g_swap_chain_occluded = false;
 
 bool CreateDeviceAndSwapChain(HWND hwnd) {
   DXGI_SWAP_CHAIN_DESC sd = {};
@@ -282,17 +291,20 @@ bool IsTrafficRequest(DWORD request_id) {
          request_id == kRequestTrafficHelicopter;
 }
 
-void AddOrUpdateTrafficEntry(std::vector<TrafficEntry> *traffic,
-                             DWORD object_id, const TrafficSimData &data) {
-  if (!traffic)
+void AddOrUpdateTrafficEntry(BridgeState *state, DWORD object_id,
+                             const TrafficSimData &data) {
+  const auto inserted =
+      state->traffic_index.emplace(object_id, state->traffic.size());
+  if (!inserted.second) {
+    state->traffic[inserted.first->second].data = data;
     return;
-  for (TrafficEntry &entry : *traffic) {
-    if (entry.object_id == object_id) {
-      entry.data = data;
-      return;
-    }
   }
-  traffic->push_back({object_id, data});
+  state->traffic.push_back({object_id, data});
+}
+
+void ClearTraffic(BridgeState *state) {
+  state->traffic.clear();
+  state->traffic_index.clear();
 }
 
 msfs_bridge::OwnshipData ToOwnshipData(const OwnshipSimData &sim) {
@@ -425,7 +437,7 @@ void DisconnectSimConnect(BridgeState *state) {
   state->simconnect = nullptr;
   state->simconnect_ready = false;
   state->ownship_valid = false;
-  state->traffic.clear();
+  ClearTraffic(state);
   g_log.Info("Disconnected from SimConnect.");
 }
 
@@ -442,7 +454,7 @@ void DispatchSimConnectMessage(BridgeState *state, SIMCONNECT_RECV *msg,
     } else if (IsTrafficRequest(data->dwRequestID) &&
                data->dwObjectID != SIMCONNECT_OBJECT_ID_USER) {
       AddOrUpdateTrafficEntry(
-          &state->traffic, data->dwObjectID,
+          state, data->dwObjectID,
           *reinterpret_cast<const TrafficSimData *>(&data->dwData));
     }
     break;
@@ -487,9 +499,9 @@ void PollSimConnect(BridgeState *state) {
 void PollForeFlightDiscovery(BridgeState *state, double now) {
   if (!state->settings.foreflight_auto_discovery || !state->foreflight_receiver)
     return;
+  std::vector<uint8_t> &packet = state->discovery_packet;
+  std::string &source_ip = state->discovery_source_ip;
   while (true) {
-    std::vector<uint8_t> packet;
-    std::string source_ip;
     uint16_t source_port = 0;
     const int r =
         state->foreflight_receiver->receive(&packet, &source_ip, &source_port);
@@ -557,7 +569,7 @@ void RequestTrafficIfDue(BridgeState *state, double now) {
   if (!state->simconnect || now - state->last_traffic_request < 1.0)
     return;
   state->last_traffic_request = now;
-  state->traffic.clear();
+  ClearTraffic(state);
   const HRESULT aircraft_result = SimConnect_RequestDataOnSimObjectType(
       state->simconnect, kRequestTrafficAircraft, kDefinitionTraffic,
       kTrafficRadiusMeters, SIMCONNECT_SIMOBJECT_TYPE_AIRCRAFT);
@@ -575,6 +587,29 @@ void RequestTrafficIfDue(BridgeState *state, double now) {
   }
 }
 
+// Time until the earliest broadcast schedule comes due, mirroring the checks
+// in SendScheduledPackets. Without ownship only the heartbeat can fire, and
+// counting the stalled ownship schedules would keep the wait at zero.
+double SecondsUntilNextSend(const BridgeState &state, double now) {
+  const xp2gdl90::Settings &cfg = state.settings;
+  double next_due = std::numeric_limits<double>::infinity();
+  if (cfg.heartbeat_rate > 0.0f) {
+    next_due = state.last_heartbeat + 1.0 / cfg.heartbeat_rate;
+  }
+  if (state.ownship_valid) {
+    next_due =
+        (std::min)({next_due, state.last_geo_altitude + 1.0 / kGeoAltitudeRate,
+                    state.last_device_info + 1.0 / kForeFlightDeviceRate,
+                    state.last_ahrs + 1.0 / kForeFlightAhrsRate,
+                    state.last_traffic + 1.0 / kTrafficReportRate});
+    if (cfg.position_rate > 0.0f) {
+      next_due =
+          (std::min)(next_due, state.last_position + 1.0 / cfg.position_rate);
+    }
+  }
+  return next_due - now;
+}
+
 void SendScheduledPackets(BridgeState *state, double now) {
   const xp2gdl90::Settings &cfg = state->settings;
   const bool gps_valid =
@@ -591,10 +626,19 @@ void SendScheduledPackets(BridgeState *state, double now) {
   if (!state->ownship_valid)
     return;
 
-  const msfs_bridge::OwnshipData own = ToOwnshipData(state->ownship);
+  const bool position_due =
+      now - state->last_position >= 1.0 / cfg.position_rate;
+  const bool geo_altitude_due =
+      now - state->last_geo_altitude >= 1.0 / kGeoAltitudeRate;
+  const bool ahrs_due = now - state->last_ahrs >= 1.0 / kForeFlightAhrsRate;
+
+  // SimConnect refreshes the ownship block every sim frame, but it is only
+  // converted on the loop iterations that actually emit an ownship packet.
+  msfs_bridge::OwnshipData own;
+  if (position_due || geo_altitude_due || ahrs_due)
+    own = ToOwnshipData(state->ownship);
 
-  if (cfg.debug_logging &&
-      now - state->last_position >= 1.0 / cfg.position_rate) {
+  if (cfg.debug_logging && position_due) {
     g_log.Info("[debug] ownship lat=" + std::to_string(own.latitude_deg) +
                " lon=" + std::to_string(own.longitude_deg) +
                " palt=" + std::to_string(own.pressure_altitude_ft) + "ft" +
@@ -603,26 +647,25 @@ void SendScheduledPackets(BridgeState *state, double now) {
                (own.sim_on_ground ? "Y" : "N") + " cs=" + own.callsign);
   }
 
-  if (cfg.position_rate > 0.0f &&
-      now - state->last_position >= 1.0 / cfg.position_rate) {
+  if (cfg.position_rate > 0.0f && position_due) {
     SendPacket(state, state->encoder->createOwnshipReport(
                           msfs_bridge::BuildOwnshipPosition(own, cfg)));
     state->last_position = now;
   }
 
-  if (now - state->last_geo_altitude >= 1.0 / kGeoAltitudeRate) {
+  if (geo_altitude_due) {
     SendPacket(state, state->encoder->createOwnshipGeometricAltitude(
                           msfs_bridge::BuildGeoAltitude(own)));
     state->last_geo_altitude = now;
   }
 
   if (now - state->last_device_info >= 1.0 / kForeFlightDeviceRate) {
-    SendPacket(state, state->foreflight_encoder->createIdMessage(
+    SendPacket(state, state->foreflight_encoder->cachedIdMessage(
                           msfs_bridge::BuildDeviceInfo(cfg)));
     state->last_device_info = now;
   }
 
-  if (now - state->last_ahrs >= 1.0 / kForeFlightAhrsRate) {
+  if (ahrs_due) {
     SendPacket(state, state->foreflight_encoder->createAhrsMessage(
                           msfs_bridge::BuildAhrs(own, cfg)));
     state->last_ahrs = now;
@@ -875,21 +918,18 @@ void RenderUi(BridgeState *state, double now) {
 
   ImGui::BeginChild("##log_scroll", ImVec2(0, 0), false,
                     ImGuiWindowFlags_HorizontalScrollbar);
-  {
-    std::lock_guard<std::mutex> lock(g_log.mutex);
-    for (const LogEntry &entry : g_log.entries) {
-      if (entry.is_error) {
-        ImGui::TextColored(ImVec4(1.0f, 0.4f, 0.4f, 1.0f), "%s",
-                           entry.text.c_str());
-      } else {
-        ImGui::TextUnformatted(entry.text.c_str());
-      }
-    }
-    if (g_log.scroll_to_bottom) {
-      ImGui::SetScrollHereY(1.0f);
-      g_log.scroll_to_bottom = false;
+  for (const LogEntry &entry : g_log.entries) {
+    if (entry.is_error) {
+      ImGui::TextColored(ImVec4(1.0f, 0.4f, 0.4f, 1.0f), "%s",
+                         entry.text.c_str());
+    } else {
+      ImGui::TextUnformatted(entry.text.c_str());
     }
   }
+  if (g_log.scroll_to_bottom) {
+    ImGui::SetScrollHereY(1.0f);
+    g_log.scroll_to_bottom = false;
+  }
   ImGui::EndChild(); // log_scroll
   ImGui::EndChild(); // log
 
@@ -1122,6 +1162,21 @@ int main(int argc, char **argv) {
     RefreshBroadcastTarget(&state, now);
     SendScheduledPackets(&state, now);
 
+    // A minimized or hidden window makes Present() return at once instead of
+    // waiting for vsync. Block until a window message arrives or the next
+    // packet is due rather than spinning a core. Rounding up keeps the loop
+    // from waking just short of the deadline and spinning on zero waits.
+    if (g_swap_chain_occluded &&
+        g_swap_chain->Present(0, DXGI_PRESENT_TEST) == DXGI_STATUS_OCCLUDED) {
+      const double wait_seconds = std::clamp(SecondsUntilNextSend(state, now),
+                                             0.0, kOccludedMaxWaitSeconds);
+      MsgWaitForMultipleObjects(
+          0, nullptr, FALSE,
+          static_cast<DWORD>(std::ceil(wait_seconds * 1000.0)), QS_ALLINPUT);
+      continue;
+    }
+    g_swap_chain_occluded = false;
+
     // Render
     ImGui_ImplDX11_NewFrame();
     ImGui_ImplWin32_NewFrame();
@@ -1134,7 +1189,8 @@ int main(int argc, char **argv) {
     g_device_context->OMSetRenderTargets(1, &g_rtv, nullptr);
     g_device_context->ClearRenderTargetView(g_rtv, kClear);
     ImGui_ImplDX11_RenderDrawData(ImGui::GetDrawData());
-    g_swap_chain->Present(1, 0); // vsync
+    const HRESULT present_result = g_swap_chain->Present(1, 0); // vsync
+    g_swap_chain_occluded = present_result == DXGI_STATUS_OCCLUDED;
   }
 
   DisconnectSimConnect(&state);
@@ -1,22 +1,41 @@
 #include "xp2gdl90/protocol_utils.h"
 
 #include <algorithm>
+#include <array>
 #include <cctype>
 #include <cmath>
 #include <string_view>
 
 namespace xp2gdl90::protocol {
+namespace {
+
+// Maps every byte to its callsign character, or '\0' when it is dropped.
+// Built from ASCII ranges so the result does not depend on the C locale.
+constexpr std::array<char, 256> kCallsignCharMap = [] {
+  std::array<char, 256> map{};
+  for (char ch = '0'; ch <= '9'; ++ch) {
+    map[static_cast<unsigned char>(ch)] = ch;
+  }
+  for (char ch = 'A'; ch <= 'Z'; ++ch) {
+    map[static_cast<unsigned char>(ch)] = ch;
+    map[static_cast<unsigned char>(ch - 'A' + 'a')] = ch;
+  }
+  map[static_cast<unsigned char>(' ')] = ' ';
+  map[static_cast<unsigned char>('-')] = ' ';
+  map[static_cast<unsigned char>('_')] = ' ';
+  return map;
+}();
+
+} // namespace
 
 std::string SanitizeCallsign(std::string_view input) {
   std::string out;
   out.reserve(8);
 
   for (const char ch : input) {
-    const unsigned char uch = static_cast<unsigned char>(ch);
-    if (std::isalnum(uch) != 0) {
-      out.push_back(static_cast<char>(std::toupper(uch)));
-    } else if (ch == ' ' || ch == '-' || ch == '_') {
-      out.push_back(' ');
+    const char mapped = kCallsignCharMap[static_cast<unsigned char>(ch)];
+    if (mapped != '\0') {
+      out.push_back(mapped);
     }
     if (out.size() >= 8) {
       break;
@@ -61,6 +61,8 @@ bool LoadSettingsFromJsonFile(const std::string &path, Settings *out_settings,
     return false;
   }
 
+  // operator<< reports a failing read (e.g. a directory path) through the
+  // stream state rather than throwing, so the parser just sees empty input.
   std::stringstream buffer;
   buffer << file.rdbuf();
 
@@ -1,8 +1,9 @@
 #include "xp2gdl90/settings_ui.h"
 
-#include <algorithm>
 #include <cctype>
+#include <charconv>
 #include <cstdio>
+#include <cstring>
 
 #include "xp2gdl90/protocol_utils.h"
 
@@ -14,16 +15,15 @@ std::string Trim(const char *text) {
     return "";
   }
 
-  std::string value(text);
-  auto first = std::find_if(value.begin(), value.end(), [](unsigned char ch) {
-    return std::isspace(ch) == 0;
-  });
-  auto last = std::find_if(value.rbegin(), value.rend(), [](unsigned char ch) {
-                return std::isspace(ch) == 0;
-              }).base();
-
-  if (first >= last) {
-    return "";
+  // Find the trimmed bounds in the input buffer and build the result once,
+  // rather than copying the whole field first and then the trimmed range.
+  const char *first = text;
+  const char *last = text + std::strlen(text);
+  while (first < last && std::isspace(static_cast<unsigned char>(*first))) {
+    ++first;
+  }
+  while (last > first && std::isspace(static_cast<unsigned char>(last[-1]))) {
+    --last;
   }
   return std::string(first, last);
 }
@@ -33,18 +33,24 @@ bool ParseHex24(const char *text, uint32_t *out_value) {
     return false;
   }
 
-  const std::string trimmed = Trim(text);
-  if (trimmed.empty()) {
-    return false;
+  // Scan the buffer in place: skip leading whitespace and an optional 0x
+  // prefix, then convert the hex digits without building a trimmed copy.
+  const char *begin = text;
+  const char *const end = text + std::strlen(text);
+  while (begin < end && std::isspace(static_cast<unsigned char>(*begin))) {
+    ++begin;
+  }
+  if (end - begin >= 2 && begin[0] == '0' &&
+      (begin[1] == 'x' || begin[1] == 'X')) {
+    begin += 2;
   }
 
-  try {
-    *out_value =
-        static_cast<uint32_t>(std::stoul(trimmed, nullptr, 16)) & 0xFFFFFFu;
-    return true;
-  } catch (...) {
+  unsigned long long value = 0;
+  if (std::from_chars(begin, end, value, 16).ec != std::errc()) {
     return false;
   }
+  *out_value = static_cast<uint32_t>(value) & 0xFFFFFFu;
+  return true;
 }
 
 } // namespace
@@ -1,5 +1,6 @@
 #include "xp2gdl90/udp_broadcaster.h"
 
+#include <algorithm>
 #include <cstring>
 
 #ifdef _WIN32
@@ -35,10 +36,35 @@ std::string SocketErrorMessage(const char *prefix, int code) {
 }
 #endif
 
+bool BuildTargetAddress(detail::SocketOps *socket_ops,
+                        const std::string &target_ip, uint16_t target_port,
+                        sockaddr_in *out_addr) {
+  std::memset(out_addr, 0, sizeof(*out_addr));
+  out_addr->sin_family = AF_INET;
+  out_addr->sin_port = htons(target_port);
+  return socket_ops->InetPton(AF_INET, target_ip.c_str(),
+                              &out_addr->sin_addr) == 1;
+}
+
 } // namespace
 
 namespace detail {
 
+size_t SocketOps::SendToBatch(uintptr_t socket,
+                              const std::vector<uint8_t> *buffers, size_t count,
+                              int flags, const void *dest_addr,
+                              size_t addrlen) {
+  size_t sent_count = 0;
+  for (; sent_count < count; ++sent_count) {
+    const std::vector<uint8_t> &buffer = buffers[sent_count];
+    if (SendTo(socket, buffer.data(), buffer.size(), flags, dest_addr,
+               addrlen) < 0) {
+      break;
+    }
+  }
+  return sent_count;
+}
+
 class DefaultSocketOpsImpl final : public SocketOps {
 public:
   int Startup() override {
@@ -115,6 +141,48 @@ public:
 #endif
   }
 
+#if defined(__linux__)
+  // One sendmmsg() call covers a whole traffic burst instead of one sendto()
+  // per report.
+  size_t SendToBatch(uintptr_t socket_handle,
+                     const std::vector<uint8_t> *buffers, size_t count,
+                     int flags, const void *dest_addr,
+                     size_t addrlen) override {
+    constexpr size_t kMaxBatch = 64;
+    const int socket_value = static_cast<int>(socket_handle);
+    size_t sent_count = 0;
+    while (sent_count < count) {
+      const size_t batch = (std::min)(count - sent_count, kMaxBatch);
+      iovec iovecs[kMaxBatch];
+      mmsghdr headers[kMaxBatch];
+      std::memset(headers, 0, sizeof(headers[0]) * batch);
+      for (size_t i = 0; i < batch; ++i) {
+        const std::vector<uint8_t> &buffer = buffers[sent_count + i];
+        iovecs[i].iov_base = const_cast<uint8_t *>(buffer.data());
+        iovecs[i].iov_len = buffer.size();
+        headers[i].msg_hdr.msg_name = const_cast<void *>(dest_addr);
+        headers[i].msg_hdr.msg_namelen = static_cast<socklen_t>(addrlen);
+        headers[i].msg_hdr.msg_iov = &iovecs[i];
+        headers[i].msg_hdr.msg_iovlen = 1;
+      }
+      const int sent = ::sendmmsg(socket_value, headers,
+                                  static_cast<unsigned int>(batch), flags);
+      if (sent < 0) {
+        break;
+      }
+      sent_count += static_cast<size_t>(sent);
+      if (static_cast<size_t>(sent) < batch) {
+        // Once a datagram has gone out, sendmmsg() reports success and
+        // discards the error for the one that failed. There is no errno to
+        // report, so flag it as a generic I/O error.
+        errno = EIO;
+        break;
+      }
+    }
+    return sent_count;
+  }
+#endif
+
   int CloseSocket(uintptr_t socket_handle) override {
 #ifdef _WIN32
     return ::closesocket(static_cast<SOCKET>(socket_handle));
@@ -229,12 +297,8 @@ int UDPBroadcaster::send(const uint8_t *data, size_t size) {
   }
 
   sockaddr_in target_addr;
-  std::memset(&target_addr, 0, sizeof(target_addr));
-  target_addr.sin_family = AF_INET;
-  target_addr.sin_port = htons(target_port_);
-
-  if (socket_ops_->InetPton(AF_INET, target_ip_.c_str(),
-                            &target_addr.sin_addr) != 1) {
+  if (!BuildTargetAddress(socket_ops_, target_ip_, target_port_,
+                          &target_addr)) {
     last_error_ = "Invalid IP address: " + target_ip_;
     return -1;
   }
@@ -255,6 +319,49 @@ int UDPBroadcaster::send(const std::vector<uint8_t> &data) {
   return send(data.data(), data.size());
 }
 
+int UDPBroadcaster::sendBatch(const std::vector<std::vector<uint8_t>> &messages,
+                              size_t *out_bytes_sent) {
+  if (out_bytes_sent) {
+    *out_bytes_sent = 0;
+  }
+  if (!initialized_) {
+    last_error_ = "Socket not initialized";
+    return -1;
+  }
+
+  sockaddr_in target_addr;
+  if (!BuildTargetAddress(socket_ops_, target_ip_, target_port_,
+                          &target_addr)) {
+    last_error_ = "Invalid IP address: " + target_ip_;
+    return -1;
+  }
+
+  // SendToBatch stops at a failed datagram after attempting it once. Skip
+  // that datagram so the rest of the batch still goes out, matching what
+  // per-message send() calls would do.
+  last_error_.clear();
+  size_t next = 0;
+  int sent_count = 0;
+  while (next < messages.size()) {
+    const size_t sent = socket_ops_->SendToBatch(
+        socket_, messages.data() + next, messages.size() - next, 0,
+        &target_addr, sizeof(target_addr));
+    const size_t end = next + sent;
+    for (; next < end; ++next) {
+      if (out_bytes_sent) {
+        *out_bytes_sent += messages[next].size();
+      }
+    }
+    sent_count += static_cast<int>(sent);
+    if (next < messages.size()) {
+      last_error_ =
+          SocketErrorMessage("sendto failed: ", socket_ops_->LastError());
+      ++next;
+    }
+  }
+  return sent_count;
+}
+
 void UDPBroadcaster::setTarget(const std::string &target_ip,
                                uint16_t target_port) {
   target_ip_ = target_ip;
@@ -1,6 +1,5 @@
 #include "xp2gdl90/udp_receiver.h"
 
-#include <array>
 #include <cstring>
 
 #ifdef _WIN32
@@ -23,6 +22,8 @@ namespace udp {
 
 namespace {
 
+constexpr size_t kMaxDatagramSize = 2048;
+
 #ifdef _WIN32
 std::string SocketErrorMessage(const char *prefix, int code) {
   return std::string(prefix) + std::to_string(code);
@@ -96,6 +97,14 @@ bool UDPReceiver::initialize() {
     close();
     return false;
   }
+#if defined(SO_REUSEPORT) && !defined(__linux__)
+  // BSD-derived stacks (macOS) only let several sockets share the discovery
+  // port when each sets SO_REUSEPORT; without it a second listener's bind
+  // fails. Linux already allows that with SO_REUSEADDR, where SO_REUSEPORT
+  // would instead load-balance unicast datagrams between the sockets.
+  ::setsockopt(static_cast<int>(socket_), SOL_SOCKET, SO_REUSEPORT, &reuse,
+               static_cast<socklen_t>(sizeof(reuse)));
+#endif
 #endif
 
   sockaddr_in bind_addr{};
@@ -154,15 +163,19 @@ int UDPReceiver::receive(std::vector<uint8_t> *out_data,
     return -1;
   }
 
-  std::array<uint8_t, 2048> buffer{};
+  // Receive straight into the caller's buffer. It is emptied again when no
+  // datagram arrives, but keeps its capacity, so a buffer reused across polls
+  // is only allocated once.
+  out_data->resize(kMaxDatagramSize);
   sockaddr_in source_addr{};
 #ifdef _WIN32
   int source_len = static_cast<int>(sizeof(source_addr));
   const int received = ::recvfrom(
-      static_cast<SOCKET>(socket_), reinterpret_cast<char *>(buffer.data()),
-      static_cast<int>(buffer.size()), 0,
+      static_cast<SOCKET>(socket_), reinterpret_cast<char *>(out_data->data()),
+      static_cast<int>(out_data->size()), 0,
       reinterpret_cast<sockaddr *>(&source_addr), &source_len);
   if (received == SOCKET_ERROR) {
+    out_data->clear();
     const int err = WSAGetLastError();
     if (err == WSAEWOULDBLOCK) {
       last_error_.clear();
@@ -174,9 +187,10 @@ int UDPReceiver::receive(std::vector<uint8_t> *out_data,
 #else
   socklen_t source_len = static_cast<socklen_t>(sizeof(source_addr));
   const ssize_t received =
-      ::recvfrom(static_cast<int>(socket_), buffer.data(), buffer.size(), 0,
-                 reinterpret_cast<sockaddr *>(&source_addr), &source_len);
+      ::recvfrom(static_cast<int>(socket_), out_data->data(), out_data->size(),
+                 0, reinterpret_cast<sockaddr *>(&source_addr), &source_len);
   if (received < 0) {
+    out_data->clear();
     if (errno == EAGAIN || errno == EWOULDBLOCK) {
       last_error_.clear();
       return 0;
@@ -186,7 +200,7 @@ int UDPReceiver::receive(std::vector<uint8_t> *out_data,
   }
 #endif
 
-  out_data->assign(buffer.begin(), buffer.begin() + received);
+  out_data->resize(static_cast<size_t>(received));
 
   if (out_source_ip) {
     char ip_buffer[INET_ADDRSTRLEN] = {};
@@ -1,6 +1,7 @@
 #ifndef XP2GDL90_TESTS_FRAME_TEST_UTILS_H
 #define XP2GDL90_TESTS_FRAME_TEST_UTILS_H
 
+#include <algorithm>
 #include <cstddef>
 #include <cstdint>
 #include <vector>
@@ -9,7 +10,7 @@
 
 namespace xp2gdl90::test {
 
-inline uint16_t ComputeCrc(const std::vector<uint8_t> &data) {
+inline uint16_t ComputeCrc(const uint8_t *data, size_t size) {
   static constexpr uint16_t kCrcTable[256] = {
       0x0000, 0x1021, 0x2042, 0x3063, 0x4084, 0x50a5, 0x60c6, 0x70e7, 0x8108,
       0x9129, 0xa14a, 0xb16b, 0xc18c, 0xd1ad, 0xe1ce, 0xf1ef, 0x1231, 0x0210,
@@ -42,8 +43,8 @@ inline uint16_t ComputeCrc(const std::vector<uint8_t> &data) {
       0x2e93, 0x3eb2, 0x0ed1, 0x1ef0};
 
   uint16_t crc = 0;
-  for (uint8_t byte : data) {
-    crc = kCrcTable[crc >> 8] ^ static_cast<uint16_t>(crc << 8) ^ byte;
+  for (size_t i = 0; i < size; ++i) {
+    crc = kCrcTable[crc >> 8] ^ static_cast<uint16_t>(crc << 8) ^ data[i];
   }
   return crc;
 }
@@ -53,32 +54,38 @@ inline std::vector<uint8_t> UnescapeFrame(const std::vector<uint8_t> &message) {
   ASSERT_EQ(static_cast<uint8_t>(0x7E), message.front());
   ASSERT_EQ(static_cast<uint8_t>(0x7E), message.back());
 
-  std::vector<uint8_t> unescaped;
-  for (size_t i = 1; i + 1 < message.size(); ++i) {
-    const uint8_t byte = message[i];
-    if (byte == 0x7D) {
-      ASSERT_TRUE(i + 1 < message.size() - 1);
-      const uint8_t next = message[++i];
-      unescaped.push_back(static_cast<uint8_t>(next ^ 0x20));
-    } else {
-      unescaped.push_back(byte);
-    }
+  // Unstuffing only ever shrinks the body, so write into a buffer sized for
+  // the escaped body and trim it once at the end. Runs between escape bytes
+  // are copied wholesale.
+  const auto body_begin = message.begin() + 1;
+  const auto body_end = message.end() - 1;
+  std::vector<uint8_t> unescaped(static_cast<size_t>(body_end - body_begin));
+  auto escape = std::find(body_begin, body_end, 0x7D);
+  auto out = std::copy(body_begin, escape, unescaped.begin());
+  while (escape != body_end) {
+    ASSERT_TRUE(escape + 1 != body_end);
+    *out++ = static_cast<uint8_t>(escape[1] ^ 0x20);
+    const auto next = std::find(escape + 2, body_end, 0x7D);
+    out = std::copy(escape + 2, next, out);
+    escape = next;
   }
+  unescaped.erase(out, unescaped.end());
   return unescaped;
 }
 
 inline std::vector<uint8_t>
 ExtractPayload(const std::vector<uint8_t> &message) {
-  const std::vector<uint8_t> unescaped = UnescapeFrame(message);
+  std::vector<uint8_t> unescaped = UnescapeFrame(message);
   ASSERT_TRUE(unescaped.size() >= 3);
   const size_t payload_len = unescaped.size() - 2;
-  std::vector<uint8_t> payload(unescaped.begin(),
-                               unescaped.begin() + payload_len);
 
+  // Check the CRC in place, then drop it so the payload is returned without
+  // a second copy.
   const uint16_t crc = static_cast<uint16_t>(unescaped[payload_len]) |
                        static_cast<uint16_t>(unescaped[payload_len + 1] << 8);
-  ASSERT_EQ(ComputeCrc(payload), crc);
-  return payload;
+  ASSERT_EQ(ComputeCrc(unescaped.data(), payload_len), crc);
+  unescaped.resize(payload_len);
+  return unescaped;
 }
 
 inline uint32_t Decode24(const std::vector<uint8_t> &payload, size_t offset) {
@@ -87,6 +94,12 @@ inline uint32_t Decode24(const std::vector<uint8_t> &payload, size_t offset) {
          static_cast<uint32_t>(payload[offset + 2]);
 }
 
+// Sign-extends a 24-bit two's complement field (e.g. lat/lon semicircles).
+inline int32_t DecodeSigned24(const std::vector<uint8_t> &payload,
+                              size_t offset) {
+  return static_cast<int32_t>(Decode24(payload, offset) ^ 0x800000u) - 0x800000;
+}
+
 inline uint16_t Decode16BE(const std::vector<uint8_t> &payload, size_t offset) {
   return static_cast<uint16_t>((static_cast<uint16_t>(payload[offset]) << 8) |
                                static_cast<uint16_t>(payload[offset + 1]));
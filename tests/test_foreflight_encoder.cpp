@@ -34,6 +34,28 @@ TEST_CASE("ForeFlight ID message encodes metadata in big-endian order") {
             xp2gdl90::test::Decode32BE(payload, 35));
 }
 
+TEST_CASE("ForeFlight cached ID message re-encodes only on change") {
+  gdl90::foreflight::ForeFlightEncoder encoder;
+  gdl90::foreflight::DeviceInfo info{};
+  info.device_name = "XP2GDL90";
+  info.device_long_name = "XP2GDL90 AHRS";
+  info.capabilities_mask = 0x00000001u;
+
+  const auto &first = encoder.cachedIdMessage(info);
+  ASSERT_TRUE(first == encoder.createIdMessage(info));
+  const uint8_t *first_data = first.data();
+  ASSERT_TRUE(encoder.cachedIdMessage(info).data() == first_data);
+
+  info.capabilities_mask = 0x00000003u;
+  ASSERT_TRUE(encoder.cachedIdMessage(info) == encoder.createIdMessage(info));
+  info.serial_number = 42;
+  ASSERT_TRUE(encoder.cachedIdMessage(info) == encoder.createIdMessage(info));
+  info.device_name = "OTHER";
+  ASSERT_TRUE(encoder.cachedIdMessage(info) == encoder.createIdMessage(info));
+  info.device_long_name = "OTHER LONG";
+  ASSERT_TRUE(encoder.cachedIdMessage(info) == encoder.createIdMessage(info));
+}
+
 TEST_CASE("ForeFlight AHRS message encodes attitude and heading fields") {
   gdl90::foreflight::ForeFlightEncoder encoder;
   gdl90::foreflight::AhrsData data{};
@@ -1,10 +1,22 @@
 #include "test_harness.h"
 
 #include <cstdint>
+#include <string>
 #include <vector>
 
 #include "xp2gdl90/foreflight_protocol.h"
 
+namespace {
+
+// Pads a packet with whitespace before its closing brace so it clears the
+// parser's minimum-length check and fails at the check under test instead.
+std::vector<uint8_t> PadPacket(std::vector<uint8_t> packet) {
+  packet.insert(packet.end() - 1, 32, ' ');
+  return packet;
+}
+
+} // namespace
+
 TEST_CASE("ForeFlight discovery parser requires nested GDL90 port") {
   const std::vector<uint8_t> packet{
       '{', '"', 'A', 'p', 'p', '"', ':', '"', 'F', 'o', 'r', 'e', 'F', 'l',
@@ -16,18 +28,18 @@ TEST_CASE("ForeFlight discovery parser requires nested GDL90 port") {
 }
 
 TEST_CASE("ForeFlight discovery parser rejects top-level port and bad app") {
-  const std::vector<uint8_t> top_level_port{
-      '{', '"', 'A', 'p', 'p', '"', ':', '"', 'F', 'o', 'r',
-      'e', 'F', 'l', 'i', 'g', 'h', 't', '"', ',', '"', 'p',
-      'o', 'r', 't', '"', ':', '4', '0', '0', '0', '}'};
+  const std::vector<uint8_t> top_level_port =
+      PadPacket({'{', '"', 'A', 'p', 'p', '"', ':', '"', 'F', 'o', 'r',
+                 'e', 'F', 'l', 'i', 'g', 'h', 't', '"', ',', '"', 'p',
+                 'o', 'r', 't', '"', ':', '4', '0', '0', '0', '}'});
   uint16_t port = 0;
   ASSERT_TRUE(
       !xp2gdl90::foreflight::ParseDiscoveryBroadcast(top_level_port, &port));
 
-  const std::vector<uint8_t> wrong_app{
-      '{', '"', 'A', 'p', 'p', '"', ':', '"', 'N', 'o', 't', 'F', 'F',
-      '"', ',', '"', 'G', 'D', 'L', '9', '0', '"', ':', '{', '"', 'p',
-      'o', 'r', 't', '"', ':', '4', '0', '0', '0', '}', '}'};
+  const std::vector<uint8_t> wrong_app = PadPacket(
+      {'{', '"', 'A', 'p', 'p', '"', ':', '"', 'N', 'o', 't', 'F', 'F',
+       '"', ',', '"', 'G', 'D', 'L', '9', '0', '"', ':', '{', '"', 'p',
+       'o', 'r', 't', '"', ':', '4', '0', '0', '0', '}', '}'});
   ASSERT_TRUE(!xp2gdl90::foreflight::ParseDiscoveryBroadcast(wrong_app, &port));
 }
 
@@ -44,9 +56,9 @@ TEST_CASE(
   ASSERT_TRUE(
       !xp2gdl90::foreflight::ParseDiscoveryBroadcast(array_root, &port));
 
-  const std::vector<uint8_t> missing_gdl90{'{', '"', 'A', 'p', 'p', '"', ':',
-                                           '"', 'F', 'o', 'r', 'e', 'F', 'l',
-                                           'i', 'g', 'h', 't', '"', '}'};
+  const std::vector<uint8_t> missing_gdl90 =
+      PadPacket({'{', '"', 'A', 'p', 'p', '"', ':', '"', 'F', 'o',
+                 'r', 'e', 'F', 'l', 'i', 'g', 'h', 't', '"', '}'});
   ASSERT_TRUE(
       !xp2gdl90::foreflight::ParseDiscoveryBroadcast(missing_gdl90, &port));
 
@@ -56,3 +68,20 @@ TEST_CASE(
       '"', ':', '{', '"', 'p', 'o', 'r', 't', '"', ':', '0', '}', '}'};
   ASSERT_TRUE(!xp2gdl90::foreflight::ParseDiscoveryBroadcast(bad_port, &port));
 }
+
+TEST_CASE("ForeFlight discovery parser accepts the shortest valid packet") {
+  const std::string text = R"({"App":"ForeFlight","GDL90":{"port":1}})";
+  const std::vector<uint8_t> packet(text.begin(), text.end());
+  uint16_t port = 0;
+  ASSERT_TRUE(xp2gdl90::foreflight::ParseDiscoveryBroadcast(packet, &port));
+  ASSERT_EQ(static_cast<uint16_t>(1), port);
+
+  const std::vector<uint8_t> truncated(packet.begin(), packet.end() - 1);
+  ASSERT_TRUE(!xp2gdl90::foreflight::ParseDiscoveryBroadcast(truncated, &port));
+
+  const std::string padded_array = "[" + std::string(60, ' ') + "]";
+  const std::vector<uint8_t> array_root(padded_array.begin(),
+                                        padded_array.end());
+  ASSERT_TRUE(
+      !xp2gdl90::foreflight::ParseDiscoveryBroadcast(array_root, &port));
+}
@@ -1,4 +1,5 @@
 #include <algorithm>
+#include <cmath>
 #include <cstdint>
 #include <limits>
 #include <string>
@@ -179,6 +180,39 @@ TEST_CASE("Ownship report encodes fields and clamps values") {
   ASSERT_EQ(static_cast<uint8_t>(data.emergency_code << 4), payload[27]);
 }
 
+TEST_CASE("Position report coordinates match reference across sweep") {
+  gdl90::GDL90Encoder encoder;
+  gdl90::PositionData data{};
+  constexpr double kResolution = 180.0 / 0x800000;
+
+  // One encoder and one report template for the whole grid; only the
+  // coordinates change between frames.
+  for (int lat_step = -24; lat_step <= 24; ++lat_step) {
+    for (int lon_step = -48; lon_step <= 48; lon_step += 3) {
+      const double latitude = lat_step * 3.75 + 0.0001;
+      const double longitude = lon_step * 3.75 - 0.0001;
+      data.latitude = latitude;
+      data.longitude = longitude;
+
+      const auto payload =
+          xp2gdl90::test::ExtractPayload(encoder.createTrafficReport(data));
+      ASSERT_EQ(EncodeLat(latitude), xp2gdl90::test::Decode24(payload, 5));
+      ASSERT_EQ(EncodeLon(longitude), xp2gdl90::test::Decode24(payload, 8));
+
+      const double decoded_lat =
+          xp2gdl90::test::DecodeSigned24(payload, 5) * kResolution;
+      const double decoded_lon =
+          xp2gdl90::test::DecodeSigned24(payload, 8) * kResolution;
+      ASSERT_TRUE(
+          std::abs(decoded_lat - std::max(-90.0, std::min(90.0, latitude))) <
+          kResolution);
+      ASSERT_TRUE(
+          std::abs(decoded_lon - std::max(-180.0, std::min(180.0, longitude))) <
+          kResolution);
+    }
+  }
+}
+
 TEST_CASE("Ownship report encodes invalid altitude sentinel") {
   gdl90::GDL90Encoder encoder;
   gdl90::PositionData data{};
@@ -362,3 +396,69 @@ TEST_CASE("Traffic report escapes special bytes") {
   ASSERT_EQ(static_cast<uint8_t>((altitude >> 4) & 0xFF), payload[11]);
   ASSERT_EQ(EncodeTrack(180), payload[17]);
 }
+
+TEST_CASE("Batch traffic encoding matches single reports and reuses frames") {
+  gdl90::GDL90Encoder encoder;
+  std::vector<gdl90::PositionData> reports(3);
+  reports[0].latitude = 47.5;
+  reports[0].icao_address = 0xABCDEF;
+  reports[0].callsign = "N123";
+  reports[1].longitude = -122.25;
+  reports[1].icao_address = 0x7E7D7E;
+  reports[2].altitude = 35000;
+  reports[2].callsign = "LONGCALLSIGN";
+
+  std::vector<std::vector<uint8_t>> frames(5, std::vector<uint8_t>(64, 0xFF));
+  encoder.createTrafficReports(reports, &frames);
+  ASSERT_EQ(reports.size(), frames.size());
+  for (size_t i = 0; i < reports.size(); ++i) {
+    ASSERT_TRUE(encoder.createTrafficReport(reports[i]) == frames[i]);
+  }
+
+  // Re-encoding into the same frames keeps each frame's storage.
+  const uint8_t *const first_frame_storage = frames[0].data();
+  const size_t first_frame_capacity = frames[0].capacity();
+  reports.resize(1);
+  encoder.createTrafficReports(reports, &frames);
+  ASSERT_EQ(static_cast<size_t>(1), frames.size());
+  ASSERT_TRUE(encoder.createTrafficReport(reports[0]) == frames[0]);
+  ASSERT_TRUE(first_frame_storage == frames[0].data());
+  ASSERT_EQ(first_frame_capacity, frames[0].capacity());
+
+  encoder.createTrafficReports(reports, nullptr);
+}
+
+TEST_CASE("Full traffic batch decodes every target") {
+  gdl90::GDL90Encoder encoder;
+  constexpr double kResolution = 180.0 / 0x800000;
+
+  // 63 is the configurable traffic target ceiling; check every frame rather
+  // than sampling a few.
+  std::vector<gdl90::PositionData> reports(63);
+  for (size_t i = 0; i < reports.size(); ++i) {
+    const double step = static_cast<double>(i) - 31.0;
+    reports[i].latitude = step * 2.85;
+    reports[i].longitude = step * 5.7;
+    reports[i].icao_address = 0x7D7E00u + static_cast<uint32_t>(i);
+    reports[i].callsign = "T" + std::to_string(i);
+  }
+
+  std::vector<std::vector<uint8_t>> frames;
+  encoder.createTrafficReports(reports, &frames);
+  ASSERT_EQ(reports.size(), frames.size());
+
+  for (size_t i = 0; i < reports.size(); ++i) {
+    const auto payload = xp2gdl90::test::ExtractPayload(frames[i]);
+    ASSERT_EQ(static_cast<uint8_t>(gdl90::MSG_ID_TRAFFIC_REPORT), payload[0]);
+    ASSERT_EQ(reports[i].icao_address, xp2gdl90::test::Decode24(payload, 2));
+    ASSERT_TRUE(
+        std::abs(xp2gdl90::test::DecodeSigned24(payload, 5) * kResolution -
+                 reports[i].latitude) < kResolution);
+    ASSERT_TRUE(
+        std::abs(xp2gdl90::test::DecodeSigned24(payload, 8) * kResolution -
+                 reports[i].longitude) < kResolution);
+    const std::string callsign(payload.begin() + 19, payload.begin() + 27);
+    ASSERT_EQ(reports[i].callsign,
+              callsign.substr(0, callsign.find_last_not_of(' ') + 1));
+  }
+}
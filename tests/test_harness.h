@@ -1,18 +1,20 @@
 #pragma once
 
 #include <exception>
-#include <functional>
 #include <iostream>
 #include <sstream>
+#include <stdexcept>
 #include <string>
 #include <utility>
 #include <vector>
 
 namespace test_harness {
 
+using TestFn = void (*)();
+
 struct TestCase {
   std::string name;
-  std::function<void()> fn;
+  TestFn fn;
 };
 
 inline std::vector<TestCase> &Registry() {
@@ -21,8 +23,8 @@ inline std::vector<TestCase> &Registry() {
 }
 
 struct Registrar {
-  Registrar(std::string name, std::function<void()> fn) {
-    Registry().push_back(TestCase{std::move(name), std::move(fn)});
+  Registrar(std::string name, TestFn fn) {
+    Registry().push_back(TestCase{std::move(name), fn});
   }
 };
 
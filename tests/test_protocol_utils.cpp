@@ -18,6 +18,13 @@ TEST_CASE("SanitizeCallsign trims trailing spaces and allows empty fallback") {
   ASSERT_EQ(std::string(""), xp2gdl90::protocol::SanitizeCallsign("!!!"));
 }
 
+TEST_CASE("SanitizeCallsign drops non-ASCII bytes") {
+  ASSERT_EQ(std::string("ZRICH"),
+            xp2gdl90::protocol::SanitizeCallsign("Z\xC3\xBCrich\xFF"));
+  ASSERT_EQ(std::string("AB"),
+            xp2gdl90::protocol::SanitizeCallsign(std::string("a\0b", 3)));
+}
+
 TEST_CASE("IPv4 validator accepts dotted-quad addresses only") {
   ASSERT_TRUE(xp2gdl90::protocol::IsValidIpv4Address("127.0.0.1"));
   ASSERT_TRUE(xp2gdl90::protocol::IsValidIpv4Address("255.255.255.255"));
@@ -226,6 +226,18 @@ TEST_CASE("Settings loader reports malformed JSON") {
   ASSERT_TRUE(error.find("Invalid settings JSON:") != std::string::npos);
 }
 
+TEST_CASE("Settings loader rejects a directory path without throwing") {
+  const std::filesystem::path path = MakeTempPath("settings_dir");
+  ScopedFileCleanup cleanup(path);
+  std::filesystem::create_directory(path);
+
+  xp2gdl90::Settings loaded;
+  std::string error;
+  ASSERT_TRUE(
+      !xp2gdl90::LoadSettingsFromJsonFile(path.string(), &loaded, &error));
+  ASSERT_TRUE(error.find("Invalid settings JSON:") != std::string::npos);
+}
+
 TEST_CASE("Settings saver rejects invalid target IP and write failures") {
   xp2gdl90::Settings settings;
   settings.target_ip = "not-an-ip";
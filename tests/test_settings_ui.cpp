@@ -122,6 +122,25 @@ TEST_CASE("Settings UI builder requires output settings object") {
               std::string::npos);
 }
 
+TEST_CASE("Settings UI builder parses padded and unprefixed ICAO hex") {
+  xp2gdl90::SettingsUiState ui_state;
+  xp2gdl90::LoadDefaultSettingsUiState(&ui_state);
+  xp2gdl90::Settings built;
+  std::string error;
+
+  std::snprintf(ui_state.icao_address, sizeof(ui_state.icao_address),
+                "  0xabc123 ");
+  ASSERT_TRUE(xp2gdl90::BuildConfigFromSettingsUi(
+      ui_state, xp2gdl90::Settings{}, &built, &error));
+  ASSERT_EQ(static_cast<uint32_t>(0xABC123), built.icao_address);
+
+  std::snprintf(ui_state.icao_address, sizeof(ui_state.icao_address),
+                "1A2B3C4D");
+  ASSERT_TRUE(xp2gdl90::BuildConfigFromSettingsUi(
+      ui_state, xp2gdl90::Settings{}, &built, &error));
+  ASSERT_EQ(static_cast<uint32_t>(0x2B3C4D), built.icao_address);
+}
+
 TEST_CASE("Settings UI builder rejects invalid numeric ranges") {
   xp2gdl90::SettingsUiState ui_state;
   std::snprintf(ui_state.target_ip, sizeof(ui_state.target_ip), "127.0.0.1");
@@ -185,6 +204,13 @@ TEST_CASE(
   ASSERT_TRUE(error.find("ICAO address must be a hex value") !=
               std::string::npos);
 
+  xp2gdl90::LoadDefaultSettingsUiState(&ui_state);
+  std::snprintf(ui_state.icao_address, sizeof(ui_state.icao_address), " 0x");
+  ASSERT_TRUE(!xp2gdl90::BuildConfigFromSettingsUi(
+      ui_state, xp2gdl90::Settings{}, &built, &error));
+  ASSERT_TRUE(error.find("ICAO address must be a hex value") !=
+              std::string::npos);
+
   xp2gdl90::LoadDefaultSettingsUiState(&ui_state);
   ui_state.emitter_category = 40;
   ASSERT_TRUE(!xp2gdl90::BuildConfigFromSettingsUi(
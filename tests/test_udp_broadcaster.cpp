@@ -12,7 +12,9 @@
 #include <sys/socket.h>
 #endif
 
+#include "udp_test_utils.h"
 #include "xp2gdl90/udp_broadcaster.h"
+#include "xp2gdl90/udp_receiver.h"
 
 #if defined(XP2GDL90_ENABLE_SOCKET_OPS_TESTS)
 namespace udp {
@@ -33,6 +35,7 @@ struct FakeSocketOps final : udp::detail::SocketOps {
   int setsockopt_result = 0;
   int inet_pton_result = 1;
   intptr_t sendto_result = -1;
+  int failing_sendto_call = 0; // 1-based call that fails; 0 = none
   int close_result = 0;
   int last_error_value = 0;
 
@@ -71,6 +74,9 @@ struct FakeSocketOps final : udp::detail::SocketOps {
   intptr_t SendTo(uintptr_t, const void *, size_t, int, const void *,
                   size_t) override {
     ++sendto_calls;
+    if (sendto_calls == failing_sendto_call) {
+      return -1;
+    }
     return sendto_result;
   }
 
@@ -188,6 +194,11 @@ TEST_CASE("Default POSIX socket ops report invalid operation failures") {
             ops.SendTo(udp::UDPBroadcaster::kInvalidSocket, &payload,
                        sizeof(payload), 0, &target_addr, sizeof(target_addr)));
 
+  const std::vector<uint8_t> batch[2] = {{0x01}, {0x02, 0x03}};
+  ASSERT_EQ(static_cast<size_t>(0),
+            ops.SendToBatch(udp::UDPBroadcaster::kInvalidSocket, batch, 2, 0,
+                            &target_addr, sizeof(target_addr)));
+
   ASSERT_EQ(-1, ops.CloseSocket(udp::UDPBroadcaster::kInvalidSocket));
   ASSERT_NE(0, ops.LastError());
 
@@ -236,3 +247,114 @@ TEST_CASE("UDPBroadcaster sends data after initialize") {
   broadcaster.close();
   ASSERT_TRUE(!broadcaster.isInitialized());
 }
+
+TEST_CASE("UDPBroadcaster batch send resolves target once and counts bytes") {
+  FakeSocketOps ops;
+  ops.create_socket_result = 42;
+  ops.sendto_result = 1;
+
+  udp::UDPBroadcaster broadcaster("127.0.0.1", 4000, &ops);
+  ASSERT_TRUE(broadcaster.initialize());
+
+  const std::vector<std::vector<uint8_t>> messages{
+      {0x7E, 0x00, 0x7E}, {0x7E, 0x14, 0x01, 0x7E}, {0x7E, 0x0A, 0x7E}};
+  size_t bytes_sent = 0;
+  ASSERT_EQ(3, broadcaster.sendBatch(messages, &bytes_sent));
+  ASSERT_EQ(static_cast<size_t>(10), bytes_sent);
+  ASSERT_EQ(3, ops.sendto_calls);
+  ASSERT_EQ(1, ops.inet_pton_calls);
+  ASSERT_EQ(std::string(""), broadcaster.getLastError());
+
+  ASSERT_EQ(0, broadcaster.sendBatch({}, &bytes_sent));
+  ASSERT_EQ(static_cast<size_t>(0), bytes_sent);
+  broadcaster.close();
+}
+
+TEST_CASE("UDPBroadcaster batch send skips failed datagrams") {
+  FakeSocketOps ops;
+  ops.create_socket_result = 42;
+  ops.sendto_result = -1;
+  ops.last_error_value = EINVAL;
+
+  udp::UDPBroadcaster broadcaster("127.0.0.1", 4000, &ops);
+  size_t bytes_sent = 7;
+  const std::vector<std::vector<uint8_t>> messages{{0x01}, {0x02}};
+  ASSERT_EQ(-1, broadcaster.sendBatch(messages, &bytes_sent));
+  ASSERT_EQ(static_cast<size_t>(0), bytes_sent);
+
+  ASSERT_TRUE(broadcaster.initialize());
+  ASSERT_EQ(0, broadcaster.sendBatch(messages));
+  ASSERT_EQ(2, ops.sendto_calls);
+  ASSERT_TRUE(broadcaster.getLastError().find("sendto failed") !=
+              std::string::npos);
+
+  ops.inet_pton_result = 0;
+  ASSERT_EQ(-1, broadcaster.sendBatch(messages));
+  ASSERT_TRUE(broadcaster.getLastError().find("Invalid IP address") !=
+              std::string::npos);
+  broadcaster.close();
+}
+
+TEST_CASE("UDPBroadcaster batch send attempts a failed datagram only once") {
+  FakeSocketOps ops;
+  ops.create_socket_result = 42;
+  ops.sendto_result = 1;
+  ops.failing_sendto_call = 2;
+  ops.last_error_value = ENOBUFS;
+
+  udp::UDPBroadcaster broadcaster("127.0.0.1", 4000, &ops);
+  ASSERT_TRUE(broadcaster.initialize());
+
+  const std::vector<std::vector<uint8_t>> messages{
+      {0x01}, {0x02, 0x03}, {0x04, 0x05, 0x06}};
+  size_t bytes_sent = 0;
+  ASSERT_EQ(2, broadcaster.sendBatch(messages, &bytes_sent));
+  ASSERT_EQ(static_cast<size_t>(4), bytes_sent);
+  ASSERT_EQ(3, ops.sendto_calls);
+  ASSERT_TRUE(broadcaster.getLastError().find("sendto failed") !=
+              std::string::npos);
+  broadcaster.close();
+}
+
+TEST_CASE("UDPBroadcaster delivers every datagram of a loopback batch") {
+  constexpr uint16_t kPort = 47612;
+  udp::UDPReceiver receiver(kPort);
+  ASSERT_TRUE(receiver.initialize());
+  udp::UDPBroadcaster broadcaster("127.0.0.1", kPort);
+  ASSERT_TRUE(broadcaster.initialize());
+
+  // 70 datagrams cross the 64-message sendmmsg() chunk on Linux. Each one
+  // carries its index so loss or reordering shows up below.
+  std::vector<std::vector<uint8_t>> messages;
+  for (uint8_t i = 0; i < 70; ++i) {
+    messages.push_back({0x7E, i, 0x00, 0x7E});
+  }
+  size_t bytes_sent = 0;
+  ASSERT_EQ(70, broadcaster.sendBatch(messages, &bytes_sent));
+  ASSERT_EQ(static_cast<size_t>(280), bytes_sent);
+  ASSERT_EQ(std::string(""), broadcaster.getLastError());
+
+  std::vector<uint8_t> packet;
+  for (const std::vector<uint8_t> &expected : messages) {
+    const int received = xp2gdl90::test::ReceiveWithRetry(&receiver, &packet);
+    ASSERT_EQ(4, received);
+    ASSERT_TRUE(expected == packet);
+  }
+  ASSERT_EQ(0, receiver.receive(&packet));
+
+  // An oversized datagram fails on its own; its neighbours still arrive.
+  const std::vector<std::vector<uint8_t>> with_oversized{
+      {0x01}, std::vector<uint8_t>(70000, 0x00), {0x02, 0x03}};
+  ASSERT_EQ(2, broadcaster.sendBatch(with_oversized, &bytes_sent));
+  ASSERT_EQ(static_cast<size_t>(3), bytes_sent);
+  ASSERT_TRUE(broadcaster.getLastError().find("sendto failed") !=
+              std::string::npos);
+  for (size_t index : {size_t{0}, size_t{2}}) {
+    const int received = xp2gdl90::test::ReceiveWithRetry(&receiver, &packet);
+    ASSERT_EQ(static_cast<int>(with_oversized[index].size()), received);
+    ASSERT_TRUE(with_oversized[index] == packet);
+  }
+
+  broadcaster.close();
+  receiver.close();
+}
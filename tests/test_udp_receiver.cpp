@@ -0,0 +1,68 @@
+#include "test_harness.h"
+
+#include <cstdint>
+#include <string>
+#include <vector>
+
+#include "udp_test_utils.h"
+#include "xp2gdl90/udp_broadcaster.h"
+#include "xp2gdl90/udp_receiver.h"
+
+namespace {
+
+constexpr uint16_t kLoopbackPort = 47611;
+
+} // namespace
+
+TEST_CASE("UDPReceiver rejects receive before initialize and without buffer") {
+  udp::UDPReceiver receiver(kLoopbackPort);
+  std::vector<uint8_t> packet;
+  ASSERT_EQ(-1, receiver.receive(&packet));
+  ASSERT_TRUE(receiver.getLastError().find("Socket not initialized") !=
+              std::string::npos);
+
+  ASSERT_TRUE(receiver.initialize());
+  ASSERT_TRUE(receiver.initialize());
+  ASSERT_EQ(kLoopbackPort, receiver.getListenPort());
+  ASSERT_EQ(-1, receiver.receive(nullptr));
+  ASSERT_TRUE(receiver.getLastError().find("Output buffer is required") !=
+              std::string::npos);
+
+  receiver.close();
+  ASSERT_TRUE(!receiver.isInitialized());
+}
+
+TEST_CASE("UDPReceiver receives loopback datagrams into a kept buffer") {
+  udp::UDPReceiver receiver(kLoopbackPort);
+  ASSERT_TRUE(receiver.initialize());
+
+  // Idle polls leave the buffer empty but keep its storage for later polls.
+  std::vector<uint8_t> packet;
+  ASSERT_EQ(0, receiver.receive(&packet));
+  ASSERT_TRUE(packet.empty());
+  const uint8_t *const storage = packet.data();
+  ASSERT_EQ(0, receiver.receive(&packet));
+  ASSERT_TRUE(packet.empty());
+  ASSERT_TRUE(storage == packet.data());
+  ASSERT_EQ(std::string(""), receiver.getLastError());
+
+  udp::UDPBroadcaster sender("127.0.0.1", kLoopbackPort);
+  ASSERT_TRUE(sender.initialize());
+  const std::vector<uint8_t> payload{0x7E, 0x00, 0x81, 0x41, 0x7E};
+  ASSERT_EQ(static_cast<int>(payload.size()), sender.send(payload));
+
+  std::string source_ip;
+  uint16_t source_port = 0;
+  ASSERT_EQ(static_cast<int>(payload.size()),
+            xp2gdl90::test::ReceiveWithRetry(&receiver, &packet, &source_ip,
+                                             &source_port));
+  ASSERT_TRUE(payload == packet);
+  ASSERT_EQ(std::string("127.0.0.1"), source_ip);
+  ASSERT_NE(static_cast<uint16_t>(0), source_port);
+  ASSERT_TRUE(storage == packet.data());
+
+  ASSERT_EQ(0, receiver.receive(&packet));
+  ASSERT_TRUE(packet.empty());
+  sender.close();
+  receiver.close();
+}
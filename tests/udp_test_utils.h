@@ -0,0 +1,33 @@
+#ifndef XP2GDL90_TESTS_UDP_TEST_UTILS_H
+#define XP2GDL90_TESTS_UDP_TEST_UTILS_H
+
+#include <chrono>
+#include <cstdint>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include "xp2gdl90/udp_receiver.h"
+
+namespace xp2gdl90::test {
+
+// Polls until a datagram (or an error) arrives, giving up after about a
+// second so a lost packet fails the test instead of hanging it.
+inline int ReceiveWithRetry(udp::UDPReceiver *receiver,
+                            std::vector<uint8_t> *out_data,
+                            std::string *out_source_ip = nullptr,
+                            uint16_t *out_source_port = nullptr) {
+  for (int attempt = 0; attempt < 100; ++attempt) {
+    const int received =
+        receiver->receive(out_data, out_source_ip, out_source_port);
+    if (received != 0) {
+      return received;
+    }
+    std::this_thread::sleep_for(std::chrono::milliseconds(10));
+  }
+  return 0;
+}
+
+} // namespace xp2gdl90::test
+
+#endif // XP2GDL90_TESTS_UDP_TEST_UTILS_H